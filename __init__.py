@@ -118,6 +118,7 @@ def register():
         bpy.app.handlers.load_post.append(reset_history_handler)
     
     # Register depsgraph handler for collection name sync on scene rename
+    # and selection change tracking for the history monitor
     if utils.viewpilot_depsgraph_handler not in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.append(utils.viewpilot_depsgraph_handler)
     
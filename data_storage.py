@@ -7,7 +7,8 @@ This allows views to persist across all scenes and survive scene deletion.
 
 import bpy
 import json
-from typing import List, Dict, Any, Optional
+import zlib
+from typing import List, Dict, Any, Optional, Tuple
 
 
 # The name of the Text datablock used for storage
@@ -23,6 +24,12 @@ SCHEMA_VERSION = 1
 # Custom property key for UUID tracking
 UUID_PROP_KEY = "viewpilot_uuid"
 
+# Scene custom property recording which storage content its saved_views
+# PropertyGroup was last synced from ("_" prefix keeps it out of the UI).
+# Bump SYNC_FORMAT_VERSION whenever dict_to_view() changes what it copies.
+SYNC_MARKER_KEY = "_viewpilot_sync_token"
+SYNC_FORMAT_VERSION = 1
+
 # Re-entrancy guard for load_data() to prevent callback recursion storms.
 _LOAD_DATA_GUARD = False
 
@@ -34,6 +41,16 @@ _STORAGE_PARSE_ERROR_REPORTED = False
 _STORAGE_WRITE_BLOCK_REPORTED = False
 _LAST_PARSE_CONTENT_HASH = None
 
+# Parsed saved-views list reused by get_saved_views() while the storage text is unchanged.
+_SAVED_VIEWS_CACHE_CONTENT = None
+_SAVED_VIEWS_CACHE = []
+# Bumped whenever get_saved_views() hands out a freshly parsed list.
+_SAVED_VIEWS_VERSION = 0
+
+# Display names derived from a saved-views list, rebuilt when that list is replaced.
+_SAVED_VIEW_NAMES_SOURCE = None
+_SAVED_VIEW_NAMES = []
+
 
 # =============================================================================
 # UUID HELPERS - For tracking scenes/view layers by persistent ID
@@ -432,13 +449,71 @@ def save_data(data: Dict[str, Any]) -> bool:
 # =============================================================================
 
 def get_saved_views() -> List[Dict[str, Any]]:
-    """Get the list of saved views."""
+    """Get the list of saved views.
+    
+    The parsed list is reused while the storage text is unchanged. The text
+    content is the cache key (not a write counter) because undo, file loads
+    and manual edits replace it too. The list and its dicts are shared with
+    every other caller: copy an entry (dict(view)) before modifying it and
+    save the copy back through the write API.
+    """
+    global _SAVED_VIEWS_CACHE_CONTENT, _SAVED_VIEWS_CACHE, _SAVED_VIEWS_VERSION
+    if _LOAD_DATA_GUARD:
+        return []
+    try:
+        content = get_data_text().as_string()
+    except (RuntimeError, ReferenceError, AttributeError, TypeError, ValueError):
+        content = None
+    # A pending parse error is re-checked by parsing (and cleared on success).
+    if content is not None and content == _SAVED_VIEWS_CACHE_CONTENT and not _STORAGE_PARSE_ERROR:
+        return _SAVED_VIEWS_CACHE
+    
     data = load_data()
-    return data.get("saved_views", [])
+    views = data.get("saved_views", [])
+    _SAVED_VIEWS_VERSION += 1
+    if content is not None and not _STORAGE_PARSE_ERROR:
+        _SAVED_VIEWS_CACHE_CONTENT = content
+        _SAVED_VIEWS_CACHE = views
+    return views
+
+
+def get_views_version() -> int:
+    """Get a counter that changes whenever the saved views may have changed.
+    
+    Follows the same storage text check as get_saved_views(), so undo, file
+    loads and manual edits bump it as well as the write API.
+    """
+    get_saved_views()
+    return _SAVED_VIEWS_VERSION
+
+
+def get_saved_view_names() -> List[str]:
+    """Get the display name of every saved view, in storage order.
+    
+    Built once per parsed saved-views list, so enum callbacks can walk a
+    plain list of strings instead of looking up each view dict. Unnamed
+    views fall back to "View N".
+    """
+    global _SAVED_VIEW_NAMES_SOURCE, _SAVED_VIEW_NAMES
+    views = get_saved_views()
+    if views is not _SAVED_VIEW_NAMES_SOURCE:
+        _SAVED_VIEW_NAMES = [view.get("name", f"View {i+1}") for i, view in enumerate(views)]
+        _SAVED_VIEW_NAMES_SOURCE = views
+    return _SAVED_VIEW_NAMES
+
+
+def get_saved_views_count() -> int:
+    """Get the number of saved views (served from the get_saved_views cache)."""
+    return len(get_saved_views())
+
+
+def has_saved_views() -> bool:
+    """Return True if at least one saved view exists (cheap enough for poll)."""
+    return bool(get_saved_views())
 
 
 def get_saved_view(index: int) -> Optional[Dict[str, Any]]:
-    """Get a single saved view by index."""
+    """Get a single saved view by index (shared cache entry; copy before modifying)."""
     views = get_saved_views()
     if 0 <= index < len(views):
         return views[index]
@@ -501,23 +576,100 @@ def delete_saved_view(index: int, auto_sync: bool = True) -> bool:
 def reorder_saved_views(new_order: List[int], auto_sync: bool = True) -> bool:
     """Reorder saved views based on new index order. Returns True if successful.
     
+    Storage is rewritten once; scene PropertyGroups are permuted in place
+    (see _reorder_scene_saved_views) instead of being cleared and rebuilt.
+    
     Args:
         new_order: List of indices representing new order
         auto_sync: If True, sync to PropertyGroup after saving
     """
     data = load_data()
     views = data["saved_views"]
-    if len(new_order) != len(views):
+    view_count = len(views)
+    if len(new_order) != view_count or sorted(new_order) != list(range(view_count)):
         return False
-    try:
-        data["saved_views"] = [views[i] for i in new_order]
-        if not save_data(data):
-            return False
-        if auto_sync:
-            sync_to_all_scenes()
+    if all(i == position for position, i in enumerate(new_order)):
         return True
-    except IndexError:
+    previous_token = _saved_views_sync_token(get_saved_views())
+    data["saved_views"] = [views[i] for i in new_order]
+    if not save_data(data):
         return False
+    if auto_sync and not _reorder_scene_saved_views(new_order, previous_token):
+        sync_to_all_scenes()
+    return True
+
+
+def move_saved_view(from_index: int, to_index: int, auto_sync: bool = True) -> bool:
+    """Move one saved view to another position. Returns True if successful.
+    
+    Args:
+        from_index: Current index of the view
+        to_index: Index the view should end up at
+        auto_sync: If True, sync to PropertyGroup after saving
+    """
+    view_count = get_saved_views_count()
+    if not (0 <= from_index < view_count and 0 <= to_index < view_count):
+        return False
+    new_order = list(range(view_count))
+    new_order.insert(to_index, new_order.pop(from_index))
+    return reorder_saved_views(new_order, auto_sync)
+
+
+def _resolve_reorder_moves(new_order: List[int]) -> List[Tuple[int, int]]:
+    """Turn a permutation into CollectionProperty.move() (from, to) steps.
+    
+    Filling slots front-to-back needs one step for a view moved up and K for
+    one moved down K places; back-to-front is the mirror image. Both are
+    computed and the shorter sequence is used.
+    """
+    view_count = len(new_order)
+    
+    forward = []
+    current = list(range(view_count))
+    for position in range(view_count):
+        source = current.index(new_order[position], position)
+        if source != position:
+            current.insert(position, current.pop(source))
+            forward.append((source, position))
+    
+    backward = []
+    current = list(range(view_count))
+    for position in range(view_count - 1, -1, -1):
+        source = current.index(new_order[position], 0, position + 1)
+        if source != position:
+            current.insert(position, current.pop(source))
+            backward.append((source, position))
+    
+    return forward if len(forward) <= len(backward) else backward
+
+
+def _reorder_scene_saved_views(new_order: List[int], previous_token: Optional[str] = None) -> bool:
+    """Apply a reorder to every scene's saved_views collection in place.
+    
+    Each misplaced item is moved straight to its final slot with
+    CollectionProperty.move(), so moving one view K places costs a single
+    move rather than K swaps or a full rebuild. Returns False (caller falls
+    back to a full sync) if any scene's collection is not the same length
+    as storage, i.e. already out of sync.
+    """
+    view_count = len(new_order)
+    scene_views = [scene.saved_views for scene in bpy.data.scenes if hasattr(scene, 'saved_views')]
+    if any(len(coll) != view_count for coll in scene_views):
+        return False
+    
+    moves = _resolve_reorder_moves(new_order)
+    for coll in scene_views:
+        for source, position in moves:
+            coll.move(source, position)
+    
+    # Scenes that were in sync before the move are in sync with the new
+    # content now; anything else loses its marker and resyncs next time.
+    sync_token = _saved_views_sync_token(get_saved_views())
+    for scene in bpy.data.scenes:
+        if hasattr(scene, 'saved_views'):
+            was_synced = previous_token is not None and scene.get(SYNC_MARKER_KEY) == previous_token
+            _set_scene_sync_marker(scene, sync_token if was_synced else None)
+    return True
 
 
 def get_next_view_number() -> int:
@@ -961,6 +1113,30 @@ def sync_to_scene_storage(scene) -> int:
     return len(views)
 
 
+def _saved_views_sync_token(views) -> Optional[str]:
+    """Token identifying the storage content a views list was parsed from.
+    
+    Only lists served from the get_saved_views() cache have a known source
+    text; anything else returns None (always sync).
+    """
+    if views is not _SAVED_VIEWS_CACHE or _SAVED_VIEWS_CACHE_CONTENT is None:
+        return None
+    crc = zlib.crc32(_SAVED_VIEWS_CACHE_CONTENT.encode("utf-8"))
+    return f"{SYNC_FORMAT_VERSION}:{crc:08x}:{len(views)}"
+
+
+def _set_scene_sync_marker(scene, token: Optional[str]) -> None:
+    """Record (or clear, for token None) the scene's sync marker."""
+    try:
+        if token is None:
+            if SYNC_MARKER_KEY in scene:
+                del scene[SYNC_MARKER_KEY]
+        elif scene.get(SYNC_MARKER_KEY) != token:
+            scene[SYNC_MARKER_KEY] = token
+    except (RuntimeError, ReferenceError, AttributeError, TypeError, KeyError):
+        pass  # Linked/non-editable scenes simply resync every time
+
+
 def sync_to_all_scenes() -> int:
     """
     Sync saved views from JSON storage to ALL Scenes' PropertyGroups.
@@ -976,6 +1152,7 @@ def sync_to_all_scenes() -> int:
             # Keep existing scene-side data untouched when JSON storage is invalid.
             return 0
         view_count = len(views)
+        sync_token = _saved_views_sync_token(views)
         controller = None
         prev_skip_enum_load = False
         try:
@@ -991,11 +1168,14 @@ def sync_to_all_scenes() -> int:
                 if not hasattr(scene, 'saved_views'):
                     continue
                 
-                # Clear and repopulate
-                scene.saved_views.clear()
-                for view_dict in views:
-                    new_view = scene.saved_views.add()
-                    dict_to_view(view_dict, new_view)
+                # Clear and repopulate, unless this scene was already synced
+                # from identical storage content.
+                if sync_token is None or scene.get(SYNC_MARKER_KEY) != sync_token:
+                    scene.saved_views.clear()
+                    for view_dict in views:
+                        new_view = scene.saved_views.add()
+                        dict_to_view(view_dict, new_view)
+                    _set_scene_sync_marker(scene, sync_token)
 
                 # Clamp per-scene active index so stale values (e.g. 17 when only
                 # 10 views exist) cannot survive sync and trigger enum warnings.
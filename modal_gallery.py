@@ -9,14 +9,27 @@ like delete, rename, update or "Remember" toggles.
 import bpy
 import blf
 import gpu
+from collections import OrderedDict
 from gpu_extras.batch import batch_for_shader
 from mathutils import Vector, Quaternion
 from .temp_paths import make_temp_png_path
+from .utils import create_camera_from_view_data
 from . import utils
+from . import data_storage
 
 # Module-level backup of draw handler - survives class reload
 _backup_draw_handler = None
 
+# Cached theme pointer for draw callbacks - reset on file load
+_theme_v3d = None
+
+def _get_theme_v3d():
+    """Return the 3D View theme, resolving the RNA path only once."""
+    global _theme_v3d
+    if _theme_v3d is None:
+        _theme_v3d = bpy.context.preferences.themes[0].view_3d
+    return _theme_v3d
+
 class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
     """Show saved views as a thumbnail filmstrip overlay"""
     bl_idname = "view3d.thumbnail_gallery"
@@ -29,6 +42,7 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
     THUMB_PADDING = 8 # Padding between thumbnails
     STRIP_MARGIN = 0  # Bottom margin (when gallery at bottom)
     TOP_MARGIN = 0   # Top margin (when gallery at top)
+    TEXTURE_CACHE_MAX_DEFAULT = 256  # Max GPU textures kept alive (LRU evicted beyond this)
     
     @classmethod
     def _get_thumb_size_max(cls):
@@ -39,8 +53,17 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
         except (ImportError, AttributeError, RuntimeError):
             return cls.THUMB_SIZE_MAX_DEFAULT
     
+    @classmethod
+    def _get_texture_cache_max(cls):
+        """Get GPU texture cache cap from preferences, with fallback."""
+        try:
+            from .preferences import get_preferences
+            return get_preferences().texture_cache_max
+        except (ImportError, AttributeError, RuntimeError):
+            return cls.TEXTURE_CACHE_MAX_DEFAULT
+    
     _draw_handler = None
-    _textures = {}
+    _textures = OrderedDict()  # index -> GPU texture, least recently used first
     _is_active = False  # Class-level flag to prevent multiple instances
     _instance = None  # Reference to active instance for external refresh
     _needs_refresh = False  # Flag set by external code to trigger refresh
@@ -125,10 +148,14 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
         self._geom_cache = {}
         self._text_dim_cache = {}
         self._display_image_names = set()
+        self._missing_textures = set()  # view indices a draw found without a texture
+        self._failed_textures = set()  # view indices with no loadable thumbnail
+        self._region_w = 0  # Cached per frame for off-screen culling (0 = unknown)
+        self._region_h = 0
         self._shader_uniform = gpu.shader.from_builtin('UNIFORM_COLOR')
         self._shader_image = gpu.shader.from_builtin('IMAGE')
         
-        # Load textures for all thumbnails
+        # Load textures for the visible thumbnails
         self._load_textures(context)
         
         # Add draw handler - Pass NO args, let draw function use bpy.context
@@ -165,31 +192,89 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
 
     def _clear_gpu_textures(self):
         """Release GPU texture objects held by the gallery instance."""
-        for tex in list(self._textures.values()):
+        textures = self._textures
+        while textures:
+            _, tex = textures.popitem()
             free_fn = getattr(tex, "free", None)
             if callable(free_fn):
                 try:
                     free_fn()
                 except (RuntimeError, ReferenceError, ValueError, AttributeError):
                     pass
-        self._textures.clear()
 
-    def _clear_display_images(self):
-        """Remove temporary display images created for Blender 4.x preview path."""
-        for name in list(self._display_image_names):
-            img = bpy.data.images.get(name)
-            if img:
+    def _get_texture(self, index):
+        """Return cached texture for a view index and mark it recently used.
+        
+        A miss queues the index for a one-shot timer that loads it right
+        after this draw (draw callbacks must not create images).
+        """
+        texture = self._textures.get(index)
+        if texture is not None:
+            self._textures.move_to_end(index)
+        elif index not in self._failed_textures:
+            if not self._missing_textures:
+                _schedule_missing_texture_load()
+            self._missing_textures.add(index)
+        return texture
+
+    def _load_missing_textures(self, context):
+        """Load the textures queued by draw misses and redraw the gallery."""
+        missing = sorted(self._missing_textures)
+        self._missing_textures.clear()
+        self._load_texture_indices(context, missing)
+        if self._is_primary_area_valid():
+            VIEW3D_OT_thumbnail_gallery._primary_area.tag_redraw()
+
+    def _store_texture(self, index, texture, cap):
+        """Cache a texture, freeing least recently used entries beyond cap."""
+        old = self._textures.pop(index, None)
+        if old is not None and old is not texture:
+            free_fn = getattr(old, "free", None)
+            if callable(free_fn):
+                try:
+                    free_fn()
+                except (RuntimeError, ReferenceError, ValueError, AttributeError):
+                    pass
+        self._textures[index] = texture
+
+        while len(self._textures) > cap:
+            _, evicted = self._textures.popitem(last=False)
+            free_fn = getattr(evicted, "free", None)
+            if callable(free_fn):
                 try:
-                    bpy.data.images.remove(img)
+                    free_fn()
                 except (RuntimeError, ReferenceError, ValueError, AttributeError):
                     pass
+
+    def _clear_display_images(self):
+        """Remove temporary display images created for Blender 4.x preview path."""
+        images = bpy.data.images
+        stale_images = [images[name] for name in self._display_image_names if name in images]
+        if stale_images:
+            try:
+                bpy.data.batch_remove(ids=stale_images)
+            except (RuntimeError, ReferenceError, ValueError, AttributeError, TypeError):
+                pass
         self._display_image_names.clear()
 
     def _batch_key(self, kind, x, y, width, height):
         return (kind, int(round(x)), int(round(y)), int(round(width)), int(round(height)))
 
+    def _is_rect_offscreen(self, x, y, width, height):
+        """True if a rect has no area or lies fully outside the drawn region."""
+        if width <= 0 or height <= 0:
+            return True
+        region_w = self._region_w
+        region_h = self._region_h
+        if region_w <= 0 or region_h <= 0:
+            return False  # Region size unknown, don't cull
+        return x + width < 0 or x > region_w or y + height < 0 or y > region_h
+
     def _get_rect_batch(self, kind, x, y, width, height):
         """Return cached GPU batch for common rectangle primitives."""
+        # Outlines of off-screen rects are never visible, skip building them
+        if kind == 'LINE' and self._is_rect_offscreen(x, y, width, height):
+            return None
         key = self._batch_key(kind, x, y, width, height)
         batch = self._geom_cache.get(key)
         if batch is not None:
@@ -371,7 +456,6 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
         elif event.type == 'F2' and event.value == 'PRESS':
             hover_index = self._hover_index
             if hover_index >= 0:
-                from . import data_storage
                 if hover_index >= len(data_storage.get_saved_views()):
                     return {'PASS_THROUGH'}
                 bpy.ops.view3d.rename_saved_view('INVOKE_DEFAULT', index=hover_index)
@@ -395,7 +479,6 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
                 rx, ry, rw, rh = self._reorder_btn_rect
                 if rx <= mx <= rx + rw and ry <= my <= ry + rh:
                     # Only open reorder if we have at least 2 views
-                    from . import data_storage
                     if len(data_storage.get_saved_views()) >= 2:
                         bpy.ops.view3d.reorder_views('INVOKE_DEFAULT')
                     else:
@@ -489,7 +572,6 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
         # Mouse wheel scrolling (only when scrolling is needed)
         elif event.type in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'}:
             if self._is_mouse_over_gallery(context, event):
-                from . import data_storage
                 num_views = len(data_storage.get_saved_views())
                 visible_count = self._get_visible_count(context)
                 max_offset = max(0, num_views - visible_count)
@@ -517,9 +599,11 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
         primary = VIEW3D_OT_thumbnail_gallery._primary_area
         if not primary:
             return False
-        if primary.type != 'VIEW_3D':
+        # Resolve against live windows first (pointer comparison only), so a
+        # freed area is never dereferenced.
+        if utils.find_window_for_area(bpy.context, primary) is None:
             return False
-        return utils.find_window_for_area(bpy.context, primary) is not None
+        return primary.type == 'VIEW_3D'
     
     def _promote_new_primary_area(self, context):
         """Promote the next available 3D view to primary and restart modal."""
@@ -566,10 +650,10 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
             from .thumbnail_generator import generate_thumbnail
             from .state_controller import get_controller, UpdateSource, LockPriority
             from .preview_manager import reload_all_previews
-            from . import data_storage
-            from types import SimpleNamespace
             
-            views = data_storage.get_saved_views()
+            # Work on copies so the shared saved-views cache only changes
+            # through a successful save below.
+            views = [dict(view) for view in data_storage.get_saved_views()]
             if not views:
                 return
             
@@ -656,13 +740,8 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
                         region.view_perspective = 'ORTHO'
                     space.lens = view_dict.get("lens", 50.0)
                     
-                    # Create SimpleNamespace for thumbnail generator
-                    temp_view = SimpleNamespace(**view_dict)
-                    temp_view.location = tuple(view_dict.get("location", [0, 0, 0]))
-                    temp_view.rotation = tuple(rotation)
-                    
                     # Generate thumbnail for current viewport state
-                    image_name = generate_thumbnail(context, temp_view, refresh_preview=False)
+                    image_name = generate_thumbnail(context, view_dict, refresh_preview=False)
                     if image_name:
                         # Update in-memory only (no disk I/O yet)
                         view_dict["thumbnail_image"] = image_name
@@ -672,9 +751,11 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
                 if updated_any:
                     data = data_storage.load_data()
                     data["saved_views"] = views
-                    data_storage.save_data(data)
-                    data_storage.sync_to_all_scenes()
-                    reload_all_previews(context)
+                    if data_storage.save_data(data):
+                        data_storage.sync_to_all_scenes()
+                        reload_all_previews(context)
+                    else:
+                        self.report({'ERROR'}, "Can't save regenerated thumbnails: ViewPilot storage is corrupted")
                 
             finally:
                 # Always restore state, even on exceptions
@@ -760,65 +841,93 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
             traceback.print_exc()
     
     def _load_textures(self, context):
-        """Load GPU textures for all saved view thumbnails.
+        """(Re)load GPU textures for the thumbnails on the visible page.
         
-        Uses version-based approach:
-        - Blender 5.0+: Direct gpu.texture.from_image() works correctly with Non-Color
-        - Blender 4.x: Use save_render() workaround to fix washed-out colors
+        Off-page and LRU-evicted thumbnails are loaded on demand: a draw miss
+        queues the index and the next modal event loads it.
         """
-        from . import data_storage
         self._clear_gpu_textures()
         self._invalidate_layout_cache()
-        
-        # Check Blender version - 5.0+ handles Non-Color correctly in GPU textures
-        use_direct_method = bpy.app.version >= (5, 0, 0)
+        self._missing_textures.clear()
+        self._failed_textures.clear()
         
         # Clean up previously generated display images before rebuilding textures.
         self._clear_display_images()
         
+        self._load_texture_indices(context, self._visible_view_range(context))
+    
+    def _visible_view_range(self, context):
+        """Range of view indices on the current gallery page."""
+        num_views = len(data_storage.get_saved_views())
+        visible_count = self._get_visible_count(context)
+        start_idx = min(self._scroll_offset, max(0, num_views - visible_count))
+        return range(start_idx, min(num_views, start_idx + visible_count))
+    
+    def _load_texture_indices(self, context, indices):
+        """Create and cache textures for the given view indices."""
         views = data_storage.get_saved_views()
-        for i, view_dict in enumerate(views):
-            thumb_name = view_dict.get("thumbnail_image", "")
-            if thumb_name:
-                img = bpy.data.images.get(thumb_name)
-                if img:
-                    try:
-                        if use_direct_method:
-                            # Blender 5.0+: Direct texture creation works correctly
-                            texture = gpu.texture.from_image(img)
-                            self._textures[i] = texture
-                        else:
-                            # Blender 4.x: Use save_render() to apply display transform
-                            # This fixes washed-out colors from Non-Color images
-                            import os
-
-                            temp_path = make_temp_png_path("vp_gallery_", thumb_name)
-                            img.save_render(temp_path)
-                            
-                            # Load the color-corrected image
-                            display_img_name = f".VP_Display_{i}"
-                            display_img = bpy.data.images.get(display_img_name)
-                            if display_img:
-                                display_img.filepath = temp_path
-                                display_img.reload()
-                            else:
-                                display_img = bpy.data.images.load(temp_path, check_existing=False)
-                                display_img.name = display_img_name
-                            self._display_image_names.add(display_img_name)
-                            
-                            texture = gpu.texture.from_image(display_img)
-                            self._textures[i] = texture
-                            
-                            # Clean up temp file
-                            try:
-                                os.remove(temp_path)
-                            except OSError:
-                                pass
-                            
-                    except (RuntimeError, ReferenceError, AttributeError, TypeError, ValueError, OSError) as e:
-                        pass
-                else:
-                    pass
+        # Read the cap once per load; never below one page so the visible
+        # thumbnails can't evict each other.
+        cap = max(1, self._get_texture_cache_max(), self._get_visible_count(context))
+        
+        # Check Blender version - 5.0+ handles Non-Color correctly in GPU textures
+        use_direct_method = bpy.app.version >= (5, 0, 0)
+        
+        for i in indices:
+            if not (0 <= i < len(views)):
+                continue
+            texture = self._create_texture(i, views[i], use_direct_method)
+            if texture is not None:
+                self._store_texture(i, texture, cap)
+            else:
+                self._failed_textures.add(i)
+    
+    def _create_texture(self, index, view_dict, use_direct_method):
+        """Create a GPU texture for one saved view thumbnail, or None.
+        
+        Uses version-based approach:
+        - Blender 5.0+: Direct gpu.texture.from_image() works correctly with Non-Color
+        - Blender 4.x: Use save_render() workaround to fix washed-out colors
+        """
+        thumb_name = view_dict.get("thumbnail_image", "")
+        if not thumb_name:
+            return None
+        img = bpy.data.images.get(thumb_name)
+        if not img:
+            return None
+        try:
+            if use_direct_method:
+                # Blender 5.0+: Direct texture creation works correctly
+                return gpu.texture.from_image(img)
+            
+            # Blender 4.x: Use save_render() to apply display transform
+            # This fixes washed-out colors from Non-Color images
+            import os
+
+            temp_path = make_temp_png_path("vp_gallery_", thumb_name)
+            img.save_render(temp_path)
+            
+            # Load the color-corrected image
+            display_img_name = f".VP_Display_{index}"
+            display_img = bpy.data.images.get(display_img_name)
+            if display_img:
+                display_img.filepath = temp_path
+                display_img.reload()
+            else:
+                display_img = bpy.data.images.load(temp_path, check_existing=False)
+                display_img.name = display_img_name
+            self._display_image_names.add(display_img_name)
+            
+            texture = gpu.texture.from_image(display_img)
+            
+            # Clean up temp file
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return texture
+        except (RuntimeError, ReferenceError, AttributeError, TypeError, ValueError, OSError) as e:
+            return None
     
     def _calculate_thumb_size(self, context, num_views):
         """Calculate optimal thumbnail size to fit all views + buttons, respecting min/max."""
@@ -857,7 +966,6 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
 
     def _calculate_layout(self, context):
         """Calculate common layout parameters to ensure consistency."""
-        from . import data_storage
         
         # Use primary region for consistency (fallback to context.region for draw-time)
         region = VIEW3D_OT_thumbnail_gallery._primary_region or context.region
@@ -1018,6 +1126,10 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
             if not layout:
                 return
 
+            region = context.region
+            self._region_w = region.width
+            self._region_h = region.height
+
             # Unpack layout
             thumb_size = layout['thumb_size']
             start_idx = layout['start_idx']
@@ -1032,7 +1144,6 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
 
             # --- DRAW THUMBNAILS (CENTER) ---
             thumbs_start_x = start_x
-            from . import data_storage
             current_idx = context.scene.saved_views_index
             num_views = len(data_storage.get_saved_views())
 
@@ -1049,8 +1160,9 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
                 last_thumb_pos = (x, y)
 
                 # Draw content first
-                if i in self._textures:
-                    self._draw_texture(self._textures[i], x, y, self._thumb_size, self._thumb_size)
+                texture = self._get_texture(i)
+                if texture is not None:
+                    self._draw_texture(texture, x, y, self._thumb_size, self._thumb_size)
                 else:
                     self._draw_placeholder(x, y, self._thumb_size, self._thumb_size, i + 1)
 
@@ -1167,7 +1279,7 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
     
     def _draw_enlarged_preview(self, context, index):
         """Draw enlarged thumbnail preview above gallery with dark backdrop."""
-        texture = self._textures.get(index)
+        texture = self._get_texture(index)
         if not texture:
             return
         
@@ -1239,7 +1351,7 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
     def _draw_selection_highlight(self, x, y, width, height):
         """Draw highlight border for selected thumbnail using theme color."""
         # Get theme color for active object
-        theme = bpy.context.preferences.themes[0].view_3d
+        theme = _get_theme_v3d()
         color = (*theme.object_active[:3], 1.0)
 
         batch = self._get_rect_batch('LINE', x, y, width, height)
@@ -1347,7 +1459,7 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
     def _draw_hover_highlight(self, x, y, width, height):
         """Draw hover highlight border using theme color."""
         # Get theme color for selected object
-        theme = bpy.context.preferences.themes[0].view_3d
+        theme = _get_theme_v3d()
         color = (*theme.object_selected[:3], 0.8)
 
         batch = self._get_rect_batch('LINE', x, y, width, height)
@@ -1364,7 +1476,8 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
     
     def _draw_view_name(self, context, x, y, thumb_size, view_index):
         """Draw view name centered inside hovered thumbnail, clipped if too long."""
-        from . import data_storage
+        if self._is_rect_offscreen(x, y, thumb_size, thumb_size):
+            return
         views = data_storage.get_saved_views()
         if view_index < 0 or view_index >= len(views):
             return
@@ -1406,7 +1519,9 @@ class VIEW3D_OT_thumbnail_gallery(bpy.types.Operator):
 
 def _reset_gallery_state():
     """Reset gallery class state - called on file load and addon reload."""
-    global _backup_draw_handler
+    global _backup_draw_handler, _theme_v3d
+    
+    _theme_v3d = None
     
     # Try to remove draw handler from backup first (survives class reload)
     if _backup_draw_handler is not None:
@@ -1429,9 +1544,14 @@ def _reset_gallery_state():
     except (RuntimeError, ReferenceError, AttributeError, TypeError, ValueError):
         pass
     
+    # Remember the owning area before state is cleared, for the redraw below
+    primary_area = getattr(VIEW3D_OT_thumbnail_gallery, "_primary_area", None)
+    
     # Reset all class-level state
     try:
-        for tex in list(VIEW3D_OT_thumbnail_gallery._textures.values()):
+        textures = VIEW3D_OT_thumbnail_gallery._textures
+        while textures:
+            _, tex = textures.popitem()
             free_fn = getattr(tex, "free", None)
             if callable(free_fn):
                 try:
@@ -1444,23 +1564,78 @@ def _reset_gallery_state():
         VIEW3D_OT_thumbnail_gallery._primary_area = None
         VIEW3D_OT_thumbnail_gallery._context_area = None
         VIEW3D_OT_thumbnail_gallery._context_menu_index = -1
-        VIEW3D_OT_thumbnail_gallery._textures.clear()
     except (RuntimeError, ReferenceError, AttributeError, TypeError, ValueError):
         pass
 
-    # Clean up any stale temp display images.
+    # Clean up any stale temp display images in a single batch removal.
     try:
-        for img in list(bpy.data.images):
-            if img.name.startswith(".VP_Display_"):
-                bpy.data.images.remove(img)
+        stale_images = [img for img in bpy.data.images if img.name.startswith(".VP_Display_")]
+        if stale_images:
+            bpy.data.batch_remove(ids=stale_images)
     except (RuntimeError, ReferenceError, AttributeError, TypeError, ValueError):
         pass
     
-    # Force redraw all 3D views to clear any stale gallery overlay.
+    # Redraw only the area that showed the gallery; sweep all 3D views only
+    # when that area is unknown or no longer valid. After a file load the
+    # stored area belongs to the freed screen, so it must be resolved against
+    # the live windows (pointer comparison only) before touching it at all.
+    if primary_area is not None and utils.find_window_for_area(bpy.context, primary_area) is not None:
+        try:
+            primary_area.tag_redraw()
+            return
+        except (RuntimeError, ReferenceError, AttributeError, TypeError, ValueError):
+            pass
     utils.tag_redraw_all_view3d(bpy.context)
 
+def _flush_missing_textures():
+    """Timer callback: load gallery textures the last draw found missing."""
+    instance = VIEW3D_OT_thumbnail_gallery._instance
+    if instance is None or not VIEW3D_OT_thumbnail_gallery._is_active:
+        return None
+    try:
+        instance._load_missing_textures(bpy.context)
+    except (RuntimeError, ReferenceError, AttributeError, TypeError, ValueError) as e:
+        print(f"[ViewPilot] Gallery texture load failed: {e}")
+    return None
+
+def _schedule_missing_texture_load():
+    """Register the one-shot missing-texture load if it isn't pending yet."""
+    if not bpy.app.timers.is_registered(_flush_missing_textures):
+        bpy.app.timers.register(_flush_missing_textures, first_interval=0.0)
+
+AUTO_START_FALLBACK_INTERVAL = 2.0  # Safety net if no depsgraph update arrives
+
+def _remove_gallery_bootstrap():
+    """Detach the one-shot auto-start handler if it's still registered."""
+    if _gallery_bootstrap in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_gallery_bootstrap)
+
+@bpy.app.handlers.persistent
+def _gallery_bootstrap(scene, depsgraph=None):
+    """One-shot depsgraph handler: start the gallery once a 3D view exists."""
+    if VIEW3D_OT_thumbnail_gallery._is_active:
+        _remove_gallery_bootstrap()
+        return
+    area, _, region = utils.find_view3d_override_context(bpy.context)
+    if not (area and region):
+        return  # Context not ready yet, wait for the next update
+    _remove_gallery_bootstrap()
+    # Operators can't be invoked safely from inside depsgraph evaluation,
+    # so hand off to an immediate timer, replacing the pending fallback.
+    if bpy.app.timers.is_registered(_auto_start_gallery):
+        bpy.app.timers.unregister(_auto_start_gallery)
+    bpy.app.timers.register(_auto_start_gallery, first_interval=0.0)
+
+def _schedule_auto_start():
+    """Start the gallery on the first depsgraph update, with a timer fallback."""
+    if _gallery_bootstrap not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_gallery_bootstrap)
+    if not bpy.app.timers.is_registered(_auto_start_gallery):
+        bpy.app.timers.register(_auto_start_gallery, first_interval=AUTO_START_FALLBACK_INTERVAL)
+
 def _auto_start_gallery():
     """Timer callback to start the gallery."""
+    _remove_gallery_bootstrap()
     # Don't toggle if already active (prevents race condition on fresh files)
     if VIEW3D_OT_thumbnail_gallery._is_active:
         return None  # Already open, nothing to do
@@ -1486,8 +1661,8 @@ def _on_load_post(dummy):
             return
     except (ImportError, AttributeError, TypeError, ValueError, RuntimeError):
         return  # Don't auto-start if we can't read preference (safer default)
-    # Auto-enable gallery after a short delay to ensure context is ready
-    bpy.app.timers.register(_auto_start_gallery, first_interval=0.5)
+    # Auto-enable gallery as soon as the context is ready
+    _schedule_auto_start()
 
 # =============================================================================
 # CONTEXT MENU FOR GALLERY THUMBNAILS
@@ -1529,15 +1704,8 @@ class VIEW3D_MT_gallery_context(bpy.types.Menu):
         
         layout.separator()
         
-        # =================================================================
-        # Remember Toggles (View Styles)
-        # =================================================================
-        layout.label(text="Remember:", icon='BOOKMARKS')
-        
-        layout.prop(view, "remember_perspective", text="Perspective")
-        layout.prop(view, "remember_shading", text="Shading")
-        layout.prop(view, "remember_overlays", text="Overlays")
-        layout.prop(view, "remember_composition", text="Composition")
+        # Remember toggles live in a submenu, only built when it's expanded
+        layout.menu("VIEW3D_MT_gallery_remember", icon='BOOKMARKS')
         
         layout.separator()
         
@@ -1554,6 +1722,25 @@ class VIEW3D_MT_gallery_context(bpy.types.Menu):
             flip_icon = 'TRIA_DOWN' if instance._flip_to_top else 'TRIA_UP'
             layout.operator("view3d.gallery_flip_position", text=flip_text, icon=flip_icon)
 
+class VIEW3D_MT_gallery_remember(bpy.types.Menu):
+    """Remember toggles (View Styles) for the right-clicked thumbnail"""
+    bl_label = "Remember"
+    bl_idname = "VIEW3D_MT_gallery_remember"
+    
+    def draw(self, context):
+        layout = self.layout
+        
+        idx = VIEW3D_OT_thumbnail_gallery._context_menu_index
+        if idx < 0 or idx >= len(context.scene.saved_views):
+            layout.label(text="No view selected")
+            return
+        
+        view = context.scene.saved_views[idx]
+        layout.prop(view, "remember_perspective", text="Perspective")
+        layout.prop(view, "remember_shading", text="Shading")
+        layout.prop(view, "remember_overlays", text="Overlays")
+        layout.prop(view, "remember_composition", text="Composition")
+
 class VIEW3D_OT_gallery_close(bpy.types.Operator):
     """Close the thumbnail gallery"""
     bl_idname = "view3d.gallery_close"
@@ -1590,7 +1777,6 @@ class VIEW3D_OT_gallery_load_view(bpy.types.Operator):
     index: bpy.props.IntProperty()
     
     def execute(self, context):
-        from . import data_storage
         views = data_storage.get_saved_views()
         if 0 <= self.index < len(views):
             context.scene.viewpilot.saved_views_enum = str(self.index)
@@ -1625,10 +1811,6 @@ class VIEW3D_OT_gallery_view_to_camera(bpy.types.Operator):
     index: bpy.props.IntProperty()
     
     def execute(self, context):
-        from mathutils import Vector, Quaternion
-        from .utils import create_camera_from_view_data
-        from . import data_storage
-        
         views = data_storage.get_saved_views()
         if not (0 <= self.index < len(views)):
             return {'CANCELLED'}
@@ -1707,6 +1889,7 @@ class VIEW3D_OT_gallery_view_to_camera(bpy.types.Operator):
 def register():
     bpy.utils.register_class(VIEW3D_OT_thumbnail_gallery)
     bpy.utils.register_class(VIEW3D_MT_gallery_context)
+    bpy.utils.register_class(VIEW3D_MT_gallery_remember)
     bpy.utils.register_class(VIEW3D_OT_gallery_close)
     bpy.utils.register_class(VIEW3D_OT_gallery_flip_position)
     bpy.utils.register_class(VIEW3D_OT_gallery_load_view)
@@ -1721,21 +1904,27 @@ def register():
     try:
         from .preferences import get_preferences
         if get_preferences().start_gallery_on_load:
-            bpy.app.timers.register(_auto_start_gallery, first_interval=0.5)
+            _schedule_auto_start()
     except (ImportError, AttributeError, TypeError, ValueError, RuntimeError):
         pass
 
 def unregister():
     # Clean up any running gallery before unregistering
     _reset_gallery_state()
-    # Remove file load handler
+    # Remove file load handler and any pending auto-start
     if _on_load_post in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(_on_load_post)
+    _remove_gallery_bootstrap()
+    if bpy.app.timers.is_registered(_auto_start_gallery):
+        bpy.app.timers.unregister(_auto_start_gallery)
+    if bpy.app.timers.is_registered(_flush_missing_textures):
+        bpy.app.timers.unregister(_flush_missing_textures)
     bpy.utils.unregister_class(VIEW3D_OT_gallery_view_to_camera)
     bpy.utils.unregister_class(VIEW3D_OT_gallery_delete_view)
     bpy.utils.unregister_class(VIEW3D_OT_gallery_load_view)
     bpy.utils.unregister_class(VIEW3D_OT_gallery_flip_position)
     bpy.utils.unregister_class(VIEW3D_OT_gallery_close)
+    bpy.utils.unregister_class(VIEW3D_MT_gallery_remember)
     bpy.utils.unregister_class(VIEW3D_MT_gallery_context)
     bpy.utils.unregister_class(VIEW3D_OT_thumbnail_gallery)
 
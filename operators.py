@@ -1,12 +1,19 @@
 # operators.py
 
 import bpy
+import math
 import time
+import numpy as np
 import traceback
+from collections import deque
+from bpy.app.handlers import persistent
 from contextlib import contextmanager
 from mathutils import Vector, Quaternion
+from mathutils.bvhtree import BVHTree
 
 from . import utils
+from . import data_storage
+from . import preview_manager
 from .utils import (
     get_current_view_state,
     states_are_similar,
@@ -24,12 +31,36 @@ from .modal_gallery import VIEW3D_OT_thumbnail_gallery
 # VIEW HISTORY OPERATORS
 # ========================================================================
 
+def _selection_fingerprint(selected_objects):
+    """Order-independent selection fingerprint without building a name set.
+
+    Uses as_pointer() rather than id(): each access to selected_objects
+    returns fresh Python wrappers, so id() would differ every call.
+    """
+    fingerprint = len(selected_objects)
+    for obj in selected_objects:
+        fingerprint ^= obj.as_pointer()
+    return fingerprint
+
+class _MonitorPending:
+    """Side effects requested during one monitor tick, flushed once at its end."""
+    __slots__ = ("reinit", "ghost", "add_state")
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.reinit = False  # Re-sync UI properties from the viewport
+        self.ghost = False  # Demote the active saved view to ghost (last active)
+        self.add_state = None  # View state to record into history
+
 class VIEW3D_OT_view_history_monitor(bpy.types.Operator):
     """Background monitor to save view state after movement settles."""
     bl_idname = "view3d.view_history_monitor"
     bl_label = "View History Monitor"
     
-    _timer = None
+    _tick_fn = None  # Bound tick callback registered with bpy.app.timers
+    _window = None  # Window the monitor was started from (tick context)
     last_known_state = None
     is_moving = False
     settle_start_time = 0.0
@@ -39,28 +70,107 @@ class VIEW3D_OT_view_history_monitor(bpy.types.Operator):
     last_scene_count = 0  # Track scene count for UUID duplicate detection
     last_view_layer_counts = {}  # Track view layer count per scene {scene_name: count}
     last_camera_count = 0  # Track camera count for dropdown sync
+    last_camera_scene = ""  # Scene the camera count was taken from
     last_maintenance_time = 0.0  # Last periodic maintenance timestamp
+    _timer_interval = 0.0  # Delay returned to bpy.app.timers for the next tick
+    _active_until = 0.0  # Keep fast polling until this timestamp
+    _last_tick_error = None  # Last error reported from _timer_tick (printed once)
     
     # Settings
-    CHECK_INTERVAL = 0.1
+    CHECK_INTERVAL_ACTIVE = 0.1  # Poll rate while moving / syncing
+    CHECK_INTERVAL_IDLE = 0.5  # Poll rate when nothing has changed for a while
+    ACTIVE_HYSTERESIS = 1.0  # Seconds to stay fast after last activity (avoids timer thrashing)
     MAINTENANCE_INTERVAL_ACTIVE = 0.5
     MAINTENANCE_INTERVAL_IDLE = 2.0
 
-    def _pass_through_tick(self, tick_start=None):
-        return {'PASS_THROUGH'}
+    def _flush_pending(self, context):
+        """Apply the tick's deferred side effects, each at most once."""
+        pending = self._pending
+        if pending.reinit or pending.ghost:
+            # Timer ticks don't redraw the UI on their own, so tag explicitly
+            # only when the panel state is about to change.
+            utils.tag_redraw_all_view3d(context)
+        if pending.reinit:
+            try:
+                context.scene.viewpilot.reinitialize_from_context(context)
+            except (RuntimeError, ReferenceError, AttributeError, ValueError):
+                pass
+        if pending.ghost:
+            self._trigger_ghost_mode(context)
+        if pending.add_state is not None:
+            add_to_history(pending.add_state)
+        pending.clear()
+
+    def _trigger_ghost_mode(self, context):
+        """If we are currently "on" a saved view, mark it as ghost (last active) and reset current index."""
+        scene = context.scene
+        if scene.saved_views_index == -1:
+            return
+        scene.viewpilot.last_active_view_index = scene.saved_views_index
+        scene.saved_views_index = -1
+        try:
+            with _suppress_saved_view_enum_load():
+                scene.viewpilot.saved_views_enum = 'NONE'
+                _set_panel_gallery_enum_safe(context, 'NONE')
+        except (TypeError, ValueError, RuntimeError, AttributeError):
+            pass
+
+    def _update_timer_interval(self, context, active, now):
+        """Poll fast while active and slow down once idle, with hysteresis."""
+        if active:
+            self._active_until = now + self.ACTIVE_HYSTERESIS
+        self._timer_interval = self.CHECK_INTERVAL_ACTIVE if now < self._active_until else self.CHECK_INTERVAL_IDLE
+
+    def _disable_orbit_mode(self, props):
+        """Turn orbit mode off in one burst of raw ID-property writes.
+
+        Raw writes skip update_orbit_mode_toggle (and its depsgraph/UI work),
+        so the fast-path mask is cleared here directly.
+        """
+        props['orbit_around_selection'] = False
+        props['orbit_initialized'] = False
+        utils.monitor_active_flags &= ~utils.MONITOR_FLAG_ORBIT
+
+    def _get_settle_delay(self):
+        """Return the settle delay preference, read once until it changes."""
+        settle_delay = utils.settle_delay_cache
+        if settle_delay is None:
+            try:
+                settle_delay = get_preferences().settle_delay
+            except (AttributeError, RuntimeError, ValueError, KeyError):
+                return 0.3  # Don't cache the fallback
+            utils.settle_delay_cache = settle_delay
+        return settle_delay
+
+    def _current_selection_hash(self, context):
+        """Return the selection hash, rebuilding it only after a depsgraph update."""
+        if utils.selection_dirty or self.last_selection_hash is None:
+            utils.selection_dirty = False
+            return _selection_fingerprint(context.selected_objects)
+        return self.last_selection_hash
 
     def _run_periodic_maintenance(self, context):
         """Run lower-frequency checks that do not need to execute every timer tick."""
-        from . import data_storage
+        # Resync fast-path mask (covers scene switches and direct ID-property writes)
+        utils.refresh_monitor_active_flags(context.scene.viewpilot)
+
+        # Nothing below can change unless an ID was updated. Scene count and
+        # active scene are checked too, as a cheap net for removals/switches.
+        if (
+            not utils.ids_dirty and
+            len(bpy.data.scenes) == self.last_scene_count and
+            context.scene.name == self.last_camera_scene
+        ):
+            return
+        utils.ids_dirty = False
 
         # --- SCENE COUNT CHANGE DETECTION ---
         current_scene_count = len(bpy.data.scenes)
         if current_scene_count != self.last_scene_count:
             if self.last_scene_count > 0:  # Skip initial detection
                 fixed = data_storage.fix_duplicate_scene_uuids()
-                # Also check for new scenes needing UUIDs
-                for scene in bpy.data.scenes:
-                    data_storage.ensure_scene_uuid(scene)
+                # Also check for new scenes needing UUIDs (spread over ticks)
+                self._pending_uuid_fixes.extend((scene.name, None) for scene in bpy.data.scenes)
             self.last_scene_count = current_scene_count
 
         # --- VIEW LAYER COUNT CHANGE DETECTION ---
@@ -77,256 +187,265 @@ class VIEW3D_OT_view_history_monitor(bpy.types.Operator):
 
             if current_vl_count != last_vl_count:
                 fixed = data_storage.fix_duplicate_view_layer_uuids(scene)
-                # Also ensure new view layers have UUIDs
-                for vl in scene.view_layers:
-                    data_storage.ensure_view_layer_uuid(vl)
+                # Also ensure new view layers have UUIDs (spread over ticks)
+                self._pending_uuid_fixes.extend((scene.name, vl.name) for vl in scene.view_layers)
                 self.last_view_layer_counts[scene.name] = current_vl_count
 
         # Remove stale tracking entries for scenes that no longer exist.
-        for scene_name in tuple(self.last_view_layer_counts.keys()):
-            if scene_name not in current_scene_names:
-                del self.last_view_layer_counts[scene_name]
+        for scene_name in self.last_view_layer_counts.keys() - current_scene_names:
+            del self.last_view_layer_counts[scene_name]
 
         # --- CAMERA COUNT CHANGE DETECTION ---
-        camera_count = sum(1 for obj in context.scene.objects if obj.type == 'CAMERA')
-        if camera_count != self.last_camera_count:
-            self.last_camera_count = camera_count
-            # Resync camera dropdown to current scene camera.
-            props = context.scene.viewpilot
-            active_cam = context.scene.camera
-            if active_cam:
-                try:
-                    props.camera_enum = active_cam.name
-                except TypeError:
-                    pass  # Enum items not yet populated
-
-    def _current_maintenance_interval(self, context):
-        """Return maintenance cadence based on current activity level."""
+        # Only recount after a depsgraph update that could add/remove cameras,
+        # or when the active scene changed.
+        scene_name = context.scene.name
+        if utils.camera_count_dirty or scene_name != self.last_camera_scene:
+            utils.camera_count_dirty = False
+            self.last_camera_scene = scene_name
+            camera_count = sum(1 for obj in context.scene.objects if obj.type == 'CAMERA')
+            if camera_count != self.last_camera_count:
+                self.last_camera_count = camera_count
+                # Resync camera dropdown to current scene camera.
+                scene = context.scene
+                active_cam = scene.camera
+                if utils.is_camera_enum_item(scene, active_cam):
+                    scene.viewpilot.camera_enum = active_cam.name
+
+    def _advance_uuid_fixes(self):
+        """Ensure a UUID for one queued scene or view layer per tick.
+
+        Entries are stored by name and resolved here, since scenes and
+        view layers may be renamed or removed between ticks.
+        """
+        scene_name, vl_name = self._pending_uuid_fixes.popleft()
+        scene = bpy.data.scenes.get(scene_name)
+        if scene is None:
+            return
         try:
-            props = context.scene.viewpilot
-            if (
-                self.is_moving or
-                self.was_in_camera_view or
-                props.orbit_around_selection or
-                props.keep_camera_active
-            ):
-                return self.MAINTENANCE_INTERVAL_ACTIVE
-        except (AttributeError, ReferenceError, RuntimeError):
+            if vl_name is None:
+                data_storage.ensure_scene_uuid(scene)
+            else:
+                vl = scene.view_layers.get(vl_name)
+                if vl is not None:
+                    data_storage.ensure_view_layer_uuid(vl)
+        except (RuntimeError, ReferenceError, AttributeError, TypeError, ValueError):
             pass
-        return self.MAINTENANCE_INTERVAL_IDLE
 
     def _maybe_run_periodic_maintenance(self, context, now):
-        interval = self._current_maintenance_interval(context)
-        if (now - self.last_maintenance_time) < interval:
+        # Cheap check first: nothing can be due before the shortest cadence,
+        # so only check the activity level once that has elapsed.
+        delta = now - self.last_maintenance_time
+        if delta < self.MAINTENANCE_INTERVAL_ACTIVE:
+            return
+        # Between the two cadences, only run while active (moving, camera
+        # view, or a sync mode enabled).
+        if delta < self.MAINTENANCE_INTERVAL_IDLE and not (
+            self.is_moving or
+            self.was_in_camera_view or
+            utils.monitor_active_flags
+        ):
             return
         self.last_maintenance_time = now
         self._run_periodic_maintenance(context)
     
-    def modal(self, context, event):
-        if event.type == 'TIMER':
-            tick_start = time.perf_counter()
-
-            controller = get_controller()
-            now = time.time()
-            self._maybe_run_periodic_maintenance(context, now)
-            
-            # Auto-initialize if needed
-            if not context.scene.viewpilot.init_complete:
-                context.scene.viewpilot.reinitialize_from_context(context)
-
-            current_state = get_current_view_state(context)
-            if not current_state:
-                return self._pass_through_tick(tick_start)
-            
-            # Check if we're in a grace period
-            # During grace period: DON'T reinitialize (to avoid fighting slider input)
-            # But DO continue tracking movement so history can be recorded after settle
-            in_grace = controller.is_in_grace_period()
-            props = context.scene.viewpilot
-            is_in_camera = current_state.get('view_perspective') == 'CAMERA'
-
-            # Orbit mode can be enabled while idle; seed selection baseline on transition.
-            if props.orbit_around_selection and not self.last_orbit_mode:
-                current_sel = frozenset(obj.name for obj in context.selected_objects)
-                self.last_selection_hash = hash(current_sel)
-            self.last_orbit_mode = bool(props.orbit_around_selection)
-
-            # Fast path: unchanged idle ticks with no special sync modes enabled.
-            if (
-                self.last_known_state is not None and
-                not self.is_moving and
-                not in_grace and
-                not self.was_in_camera_view and
-                not is_in_camera and
-                not props.orbit_around_selection and
-                not props.keep_camera_active and
-                states_are_similar(current_state, self.last_known_state)
-            ):
-                return self._pass_through_tick(tick_start)
-            
-            # --- SELECTION CHANGE DETECTION ---
-            # If orbit mode is active and selection changes, disable orbit
-            if props.orbit_around_selection:
-                # Calculate hash of current selection (names of selected objects)
-                current_sel = frozenset(obj.name for obj in context.selected_objects)
-                current_hash = hash(current_sel)
-                
-                if self.last_selection_hash is not None and current_hash != self.last_selection_hash:
-                    # Selection changed! Disable orbit mode
-                    props['orbit_around_selection'] = False
-                    props['orbit_initialized'] = False
+    def _timer_tick(self):
+        """bpy.app.timers callback: run one tick and return the next delay.
+
+        Unlike a window-manager event timer, this doesn't dispatch an event
+        (and the redraw that follows it) on every tick.
+        """
+        if not utils.monitor_running:
+            return None
+        try:
+            context = bpy.context
+            with context.temp_override(window=self._window):
+                try:
+                    self._tick(context)
+                finally:
+                    self._flush_pending(context)
+        except ReferenceError:
+            # Operator or window was freed; cancel() handles the bookkeeping.
+            return None
+        except (RuntimeError, AttributeError, TypeError, ValueError) as error:
+            # Keep ticking, but surface each distinct error once instead of
+            # several times a second.
+            message = f"{type(error).__name__}: {error}"
+            if message != self._last_tick_error:
+                self._last_tick_error = message
+                print(f"[ViewPilot] View monitor tick failed: {message}")
+                traceback.print_exc()
+        return self._timer_interval
+
+    def _tick(self, context):
+        """One monitor pass; side effects are queued on self._pending."""
+        now = time.monotonic()  # Single clock read per tick, shared by all timing checks
+        controller = get_controller()
+        pending = self._pending
+        scene = context.scene
+        props = scene.viewpilot
+        self._maybe_run_periodic_maintenance(context, now)
+        if self._pending_uuid_fixes:
+            self._advance_uuid_fixes()
+        
+        # Auto-initialize if needed
+        if not props.init_complete:
+            props.reinitialize_from_context(context)
+
+        current_state = get_current_view_state(context)
+        if not current_state:
+            return
+        
+        # Check if we're in a grace period
+        # During grace period: DON'T reinitialize (to avoid fighting slider input)
+        # But DO continue tracking movement so history can be recorded after settle
+        in_grace = controller.is_in_grace_period()
+        is_in_camera = current_state.get('view_perspective') == 'CAMERA'
+
+        # Orbit mode can be enabled while idle; seed selection baseline on transition.
+        orbit_on = bool(props.orbit_around_selection)
+        if orbit_on and not self.last_orbit_mode:
+            self.last_selection_hash = self._current_selection_hash(context)
+        self.last_orbit_mode = orbit_on
+
+        # Fast path: unchanged idle ticks with no special sync modes enabled.
+        if (
+            self.last_known_state is not None and
+            not self.is_moving and
+            not in_grace and
+            not self.was_in_camera_view and
+            not is_in_camera and
+            utils.monitor_active_flags == 0 and
+            states_are_similar(current_state, self.last_known_state)
+        ):
+            self._update_timer_interval(context, False, now)
+            return
+        
+        self._update_timer_interval(context, True, now)
+        
+        # --- SELECTION CHANGE DETECTION ---
+        # Fingerprint the selection once; tracked even when orbit is off.
+        current_hash = self._current_selection_hash(context)
+        # If orbit mode is active and selection changes, disable orbit
+        if orbit_on:
+            if self.last_selection_hash is not None and current_hash != self.last_selection_hash:
+                # Selection changed! Disable orbit mode
+                self._disable_orbit_mode(props)
+        self.last_selection_hash = current_hash
+        
+        # --- KEEP CAMERA ACTIVE MODE DETECTION ---
+        # If mode is on but camera is no longer active, turn off the mode
+        if props.keep_camera_active:
+            cam = scene.camera
+            if cam:
+                is_cam_active = (context.view_layer.objects.active == cam)
+                if not is_cam_active:
+                    # External selection change - disable the mode
+                    props['keep_camera_active'] = False
+                    utils.monitor_active_flags &= ~utils.MONITOR_FLAG_KEEP_CAMERA
+        
+        # Handle camera view - sync UI when camera properties change externally
+        if is_in_camera:
+            cam = scene.camera
+            if cam:
+                # Check if camera properties have changed externally by
+                # comparing with ViewPilot's tracked values (small threshold)
+                loc_delta_sq = (cam.location - Vector((props.loc_x, props.loc_y, props.loc_z))).length_squared
+                rot_delta_sq = (Vector(cam.rotation_euler) - Vector((props.rot_x, props.rot_y, props.rot_z))).length_squared
+                loc_changed = loc_delta_sq > 1e-8
+                rot_changed = rot_delta_sq > 1e-8
                 
-                self.last_selection_hash = current_hash
-            else:
-                # Keep tracking selection even when orbit is off
-                current_sel = frozenset(obj.name for obj in context.selected_objects)
-                self.last_selection_hash = hash(current_sel)
+                # Reinitialize when first entering OR when camera changed externally
+                # Skip if an update is in progress (grace period active)
+                if not self.was_in_camera_view or (loc_changed or rot_changed):
+                    if not in_grace:
+                        pending.reinit = True
             
-            # --- KEEP CAMERA ACTIVE MODE DETECTION ---
-            # If mode is on but camera is no longer active, turn off the mode
-            if props.keep_camera_active:
-                cam = context.scene.camera
-                if cam:
-                    is_cam_active = (context.view_layer.objects.active == cam)
-                    if not is_cam_active:
-                        # External selection change - disable the mode
-                        props['keep_camera_active'] = False
+            self.was_in_camera_view = True
+            self.last_known_state = current_state
+            self.is_moving = False
+            return
+        else:
+            # Just exited camera view - reinitialize to viewport mode
+            if self.was_in_camera_view and not in_grace:
+                pending.reinit = True
+            self.was_in_camera_view = False
+        
+        # Initialize if empty (and not in camera view)
+        if self.last_known_state is None:
+            self.last_known_state = current_state
+            pending.add_state = current_state
+            return
+        
+        # Check for difference
+        if not states_are_similar(current_state, self.last_known_state):
             
-            # Handle camera view - sync UI when camera properties change externally
-            if is_in_camera:
-                cam = context.scene.camera
-                if cam:
-                    # Check if camera properties have changed externally
-                    cam_loc = cam.location
-                    cam_rot = cam.rotation_euler
-                    
-                    # Compare with ViewPilot's tracked values (with small threshold)
-                    loc_changed = (abs(props.loc_x - cam_loc.x) > 0.0001 or
-                                   abs(props.loc_y - cam_loc.y) > 0.0001 or
-                                   abs(props.loc_z - cam_loc.z) > 0.0001)
-                    rot_changed = (abs(props.rot_x - cam_rot.x) > 0.0001 or
-                                   abs(props.rot_y - cam_rot.y) > 0.0001 or
-                                   abs(props.rot_z - cam_rot.z) > 0.0001)
-                    
-                    # Reinitialize when first entering OR when camera changed externally
-                    # Skip if an update is in progress (grace period active)
-                    if not self.was_in_camera_view or (loc_changed or rot_changed):
-                        if not in_grace:
-                            context.scene.viewpilot.reinitialize_from_context(context)
-                
-                self.was_in_camera_view = True
-                self.last_known_state = current_state
-                self.is_moving = False
-                return self._pass_through_tick(tick_start)
+            # Update UI properties to match the new viewport state (Live Sync)
+            # BUT skip if we're in a grace period (property update in progress)
+            if not in_grace:
+                pending.reinit = True
+                # Detected movement away from the current state.
+                pending.ghost = True
             else:
-                # Just exited camera view - reinitialize to viewport mode
-                if self.was_in_camera_view and not in_grace:
-                    context.scene.viewpilot.reinitialize_from_context(context)
-                self.was_in_camera_view = False
-            
-            # Initialize if empty (and not in camera view)
-            if self.last_known_state is None:
-                self.last_known_state = current_state
-                add_to_history(current_state)
-                return self._pass_through_tick(tick_start)
-            
-            # Check for difference
-            if not states_are_similar(current_state, self.last_known_state):
-                
-                # Update UI properties to match the new viewport state (Live Sync)
-                # BUT skip if we're in a grace period (property update in progress)
-                if not in_grace:
-                    try:
-                        context.scene.viewpilot.reinitialize_from_context(context)
-                    except (RuntimeError, ReferenceError, AttributeError, ValueError):
-                        pass
-                    # Detected movement away from the current state.
-                    # If we are currently "on" a saved view, mark it as ghost (last active) and reset current index
-                    if context.scene.saved_views_index != -1:
-                        context.scene.viewpilot.last_active_view_index = context.scene.saved_views_index
-                        context.scene.saved_views_index = -1
-                        try:
-                            with _suppress_saved_view_enum_load():
-                                context.scene.viewpilot.saved_views_enum = 'NONE'
-                                _set_panel_gallery_enum_safe(context, 'NONE')
-                        except (TypeError, ValueError, RuntimeError, AttributeError):
-                            pass
-                else:
-                    # We are in a grace period.
-
-                    # Special Case: USER_DRAG (Panel Sliders)
-                    # If the user is dragging the UI sliders, we ARE modifying the state.
-                    # We should NOT reinitialize (fight the user), but we SHOULD trigger Ghost Mode
-                    # because the view is no longer the pristine saved view.
-                    if controller.grace_period_source == UpdateSource.USER_DRAG:
-                        if context.scene.saved_views_index != -1:
-                            context.scene.viewpilot.last_active_view_index = context.scene.saved_views_index
-                            context.scene.saved_views_index = -1
-                            try:
-                                with _suppress_saved_view_enum_load():
-                                    context.scene.viewpilot.saved_views_enum = 'NONE'
-                                    _set_panel_gallery_enum_safe(context, 'NONE')
-                            except (TypeError, ValueError, RuntimeError, AttributeError):
-                                pass
-                    # If this is due to VIEW_RESTORE (loading a view), we should accept this new state
-                    # as the baseline immediately to prevent "Ghost View" triggering once grace ends.
-                    if controller.grace_period_source == UpdateSource.VIEW_RESTORE:
-                        self.last_known_state = current_state
-                        
-                # Check if this change is just us restoring a history state within grace period
-                # OR if the state is actually identical (floating point drift)
-                if states_are_similar(current_state, self.last_known_state):
-                    # False alarm or drift
+                # We are in a grace period.
+
+                # Special Case: USER_DRAG (Panel Sliders)
+                # If the user is dragging the UI sliders, we ARE modifying the state.
+                # We should NOT reinitialize (fight the user), but we SHOULD trigger Ghost Mode
+                # because the view is no longer the pristine saved view.
+                if controller.grace_period_source == UpdateSource.USER_DRAG:
+                    pending.ghost = True
+                # If this is due to VIEW_RESTORE (loading a view), we should accept this new state
+                # as the baseline immediately to prevent "Ghost View" triggering once grace ends.
+                # Nothing else to track for this tick - it's not user movement.
+                if controller.grace_period_source == UpdateSource.VIEW_RESTORE:
+                    self.last_known_state = current_state
                     self.is_moving = False
-                    return self._pass_through_tick(tick_start)
-
-                # Check if this change is just us restoring a history state
-                if utils.view_history_index != -1 and utils.view_history:
-                    # Safely get the state at the current index
-                    if 0 <= utils.view_history_index < len(utils.view_history):
-                        target_state = utils.view_history[utils.view_history_index]
-                        if states_are_similar(current_state, target_state):
-                            # We just restored this state. Update tracker but DON'T save as new.
-                            self.last_known_state = current_state
-                            self.is_moving = False
-                            return self._pass_through_tick(tick_start)
-
-                # --- AUTO-DISABLE ORBIT MODE ON EXTERNAL MOVEMENT ---
-                # Only disable orbit if the camera POSITION or ROTATION actually changed.
-                # Ignore perspective mode changes (ortho/persp toggle).
-                props = context.scene.viewpilot
-                if props.orbit_around_selection and not in_grace:
-                    # Check if position/rotation actually changed (not just perspective mode)
-                    pos_changed = (current_state['view_location'] - self.last_known_state['view_location']).length_squared > 0.0001
-                    rot_diff = abs(current_state['view_rotation'].dot(self.last_known_state['view_rotation']))
-                    rot_changed = rot_diff < 0.9999
-                    
-                    if pos_changed or rot_changed:
-                        props['orbit_around_selection'] = False
-                        props['orbit_initialized'] = False
-
-                # Movement detected!
-                self.is_moving = True
-                self.settle_start_time = now
-                self.last_known_state = current_state
-            
-            elif self.is_moving:
-                # No movement, but we were moving recently. Check settle timer.
-                try:
-                    settle_delay = get_preferences().settle_delay
-                except (AttributeError, RuntimeError, ValueError):
-                    settle_delay = 0.3
-                if (now - self.settle_start_time) > settle_delay:
-                    # Check if we should record this to history
-                    # (suppressed during VIEW_RESTORE, HISTORY_NAV, or grace periods)
-                    if controller.should_record_history():
-                        add_to_history(current_state)
-                    self.is_moving = False
-
-            return self._pass_through_tick(tick_start)
-                    
-        return {'PASS_THROUGH'}
+                    return
+
+            # Check if this change is just us restoring a history state
+            view_history = utils.view_history
+            view_history_index = utils.view_history_index
+            if view_history_index != -1 and view_history:
+                # Safely get the state at the current index
+                if 0 <= view_history_index < len(view_history):
+                    target_state = view_history[view_history_index]
+                    if states_are_similar(current_state, target_state):
+                        # We just restored this state. Update tracker but DON'T save as new.
+                        self.last_known_state = current_state
+                        self.is_moving = False
+                        return
+
+            # --- AUTO-DISABLE ORBIT MODE ON EXTERNAL MOVEMENT ---
+            # Only disable orbit if the camera POSITION or ROTATION actually changed.
+            # Ignore perspective mode changes (ortho/persp toggle).
+            if props.orbit_around_selection and not in_grace:
+                # Check if position/rotation actually changed (not just perspective mode)
+                pos_changed = (current_state['view_location'] - self.last_known_state['view_location']).length_squared > 0.0001
+                rot_diff = abs(current_state['view_rotation'].dot(self.last_known_state['view_rotation']))
+                rot_changed = rot_diff < 0.9999
+                
+                if pos_changed or rot_changed:
+                    self._disable_orbit_mode(props)
+
+            # Movement detected!
+            self.is_moving = True
+            self.settle_start_time = now
+            self.last_known_state = current_state
+        
+        elif self.is_moving:
+            # No movement, but we were moving recently. Check settle timer.
+            if (now - self.settle_start_time) > self._get_settle_delay():
+                # Check if we should record this to history
+                # (suppressed during VIEW_RESTORE, HISTORY_NAV, or grace periods)
+                if controller.should_record_history():
+                    pending.add_state = current_state
+                self.is_moving = False
     
+    def modal(self, context, event):
+        # Ticks run from bpy.app.timers; the modal handler only keeps the
+        # operator alive (and lets Blender cancel it on file load).
+        return {'PASS_THROUGH'}
+
     def invoke(self, context, event):
         if utils.monitor_running:
             return {'CANCELLED'}
@@ -337,18 +456,28 @@ class VIEW3D_OT_view_history_monitor(bpy.types.Operator):
         self.was_in_camera_view = False
         self.last_selection_hash = None
         self.last_orbit_mode = bool(context.scene.viewpilot.orbit_around_selection)
+        utils.refresh_monitor_active_flags(context.scene.viewpilot)
         self.last_scene_count = len(bpy.data.scenes)
         self.last_view_layer_counts = {scene.name: len(scene.view_layers) for scene in bpy.data.scenes}
         self.last_camera_count = sum(1 for obj in context.scene.objects if obj.type == 'CAMERA')
+        self.last_camera_scene = context.scene.name
+        utils.camera_count_dirty = False
         self.last_maintenance_time = 0.0
-        self._timer = context.window_manager.event_timer_add(self.CHECK_INTERVAL, window=context.window)
+        self._pending = _MonitorPending()
+        utils.settle_delay_cache = None
+        self._pending_uuid_fixes = deque()  # (scene_name, view_layer_name or None)
+        self._active_until = time.monotonic() + self.ACTIVE_HYSTERESIS
+        self._timer_interval = self.CHECK_INTERVAL_ACTIVE
+        self._window = context.window
+        self._tick_fn = self._timer_tick  # Keep one bound method so it can be unregistered
+        bpy.app.timers.register(self._tick_fn, first_interval=self.CHECK_INTERVAL_ACTIVE)
         context.window_manager.modal_handler_add(self)
         return {'RUNNING_MODAL'}
     
     def cancel(self, context):
         utils.monitor_running = False
-        if self._timer:
-            context.window_manager.event_timer_remove(self._timer)
+        if self._tick_fn and bpy.app.timers.is_registered(self._tick_fn):
+            bpy.app.timers.unregister(self._tick_fn)
 
 class VIEW3D_OT_view_history_back(bpy.types.Operator):
     """Go back in view history"""
@@ -461,27 +590,29 @@ class VIEW3D_OT_toggle_camera_selection(bpy.types.Operator):
         return context.scene.camera is not None
     
     def execute(self, context):
-        props = context.scene.viewpilot
-        cam = context.scene.camera
+        scene = context.scene
+        view_objects = context.view_layer.objects
+        props = scene.viewpilot
+        cam = scene.camera
         
         # Toggle the mode
-        props.keep_camera_active = not props.keep_camera_active
+        keep_active = not props.keep_camera_active
+        props.keep_camera_active = keep_active
         
-        if props.keep_camera_active:
+        if keep_active:
             # Mode ON: Select and make camera active
             cam.select_set(True)
-            context.view_layer.objects.active = cam
+            view_objects.active = cam
         else:
             # Mode OFF: Deselect camera
             cam.select_set(False)
-            if context.view_layer.objects.active == cam:
-                context.view_layer.objects.active = None
+            if view_objects.active == cam:
+                view_objects.active = None
         
-        # Sync camera dropdown to current scene camera (fixes blank dropdown after camera deletion)
-        try:
+        # Sync camera dropdown to current scene camera (fixes blank dropdown after camera deletion).
+        # Check membership first instead of catching the TypeError for unlisted items.
+        if utils.is_camera_enum_item(scene, cam):
             props.camera_enum = cam.name
-        except TypeError:
-            pass  # Enum items not yet populated
         
         return {'FINISHED'}
 
@@ -499,10 +630,11 @@ class VIEW3D_OT_toggle_camera_name(bpy.types.Operator):
         cam_obj = context.scene.camera
         cam_data = cam_obj.data
         
-        # Toggle both properties together
+        # Toggle both properties together, only writing the ones that differ
         new_state = not cam_data.show_name
         cam_data.show_name = new_state
-        cam_obj.show_name = new_state
+        if cam_obj.show_name != new_state:
+            cam_obj.show_name = new_state
         return {'FINISHED'}
 
 class VIEW3D_OT_exit_camera_view(bpy.types.Operator):
@@ -519,22 +651,25 @@ class VIEW3D_OT_exit_camera_view(bpy.types.Operator):
     
     @classmethod
     def poll(cls, context):
-        return (context.space_data and 
-                context.space_data.type == 'VIEW_3D' and
-                context.region_data and
-                context.region_data.view_perspective == 'CAMERA')
+        region = context.region_data
+        if region is None or region.view_perspective != 'CAMERA':
+            return False
+        space = context.space_data
+        return space is not None and space.type == 'VIEW_3D'
     
     def execute(self, context):
+        scene = context.scene
+        
         # Use Blender's view_camera operator - this properly restores the pre-camera viewport state
         bpy.ops.view3d.view_camera()
         
         # Optionally clear the scene camera
         if self.clear_camera:
-            context.scene.camera = None
+            scene.camera = None
         
         # Sync UI properties immediately
         try:
-            context.scene.viewpilot.reinitialize_from_context(context)
+            scene.viewpilot.reinitialize_from_context(context)
         except (RuntimeError, ReferenceError, AttributeError, ValueError):
             pass
         return {'FINISHED'}
@@ -552,6 +687,7 @@ class VIEW3D_OT_create_camera_from_view(bpy.types.Operator):
     def execute(self, context):
         from .utils import get_view_location, create_camera_from_view_data
         
+        scene = context.scene
         space = context.space_data
         region = context.region_data
         
@@ -580,9 +716,10 @@ class VIEW3D_OT_create_camera_from_view(bpy.types.Operator):
         
         # Use active view name if available, otherwise just the prefix
         camera_name = camera_name_prefix
-        active_view_index = context.scene.saved_views_index
-        if active_view_index >= 0 and active_view_index < len(context.scene.saved_views):
-            view_name = context.scene.saved_views[active_view_index].name
+        active_view_index = scene.saved_views_index
+        saved_views = scene.saved_views
+        if active_view_index >= 0 and active_view_index < len(saved_views):
+            view_name = saved_views[active_view_index].name
             camera_name = f"{camera_name_prefix} [{view_name}]"
         
         # Get current view data
@@ -613,23 +750,32 @@ class VIEW3D_OT_create_camera_from_view(bpy.types.Operator):
         if make_active:
             context.view_layer.objects.active = cam_obj
             cam_obj.select_set(True)
-            context.scene.camera = cam_obj
+            scene.camera = cam_obj
             
             # Swap render resolution if orientation doesn't match sensor
             # This prevents the view from jumping when centering the camera
-            render = context.scene.render
-            sensor_is_horizontal = cam_data.sensor_fit == 'HORIZONTAL' or (
-                cam_data.sensor_fit == 'AUTO' and cam_data.sensor_width >= cam_data.sensor_height
-            )
-            render_is_horizontal = render.resolution_x >= render.resolution_y
+            # create_camera_from_view_data always sets an explicit HORIZONTAL or
+            # VERTICAL fit, so the AUTO sensor-size comparison is only a fallback.
+            render = scene.render
+            res_x, res_y = render.resolution_x, render.resolution_y
+            sensor_fit = cam_data.sensor_fit
+            if sensor_fit == 'AUTO':
+                sensor_is_horizontal = cam_data.sensor_width >= cam_data.sensor_height
+            else:
+                sensor_is_horizontal = sensor_fit == 'HORIZONTAL'
+            render_is_horizontal = res_x >= res_y
             
             rotated_resolution = False
             if sensor_is_horizontal != render_is_horizontal:
-                # Swap resolution to match sensor orientation
-                render.resolution_x, render.resolution_y = render.resolution_y, render.resolution_x
-                rotated_resolution = True
+                # Swap resolution to match sensor orientation (skipped for square output)
+                if res_x != res_y:
+                    render.resolution_x, render.resolution_y = res_y, res_x
+                    rotated_resolution = True
             
-            bpy.ops.view3d.view_camera()  # Use operator to properly store previous view state
+            # Use operator to properly store previous view state. It toggles, so
+            # skip it when already in camera view (the view follows scene.camera).
+            if region.view_perspective != 'CAMERA':
+                bpy.ops.view3d.view_camera()
             bpy.ops.view3d.view_center_camera()  # Center/zoom to fit camera frame
             
             if rotated_resolution:
@@ -641,12 +787,104 @@ class VIEW3D_OT_create_camera_from_view(bpy.types.Operator):
         
         return {'FINISHED'}
 
+# Scene BVH and bounds diagonal for dolly raycasts, keyed by _scene_geometry_token().
+# Each holds at most one entry.
+_BVH_CACHE = {}
+_DIAGONAL_CACHE = {}
+_BVH_DEFERRED = object()  # _BVH_CACHE marker: token seen once, BVH not built yet
+
+def _scene_geometry_token(context):
+    """Cheap key that changes whenever the raycastable scene may have changed.
+
+    geometry_version covers edits and transforms (via the depsgraph handler);
+    the visible-object count covers hide/unhide, which only tags the scene.
+    """
+    scene = context.scene
+    return (
+        scene.name,
+        context.view_layer.name,
+        scene.frame_current,
+        utils.geometry_version,
+        len(context.visible_objects),
+    )
+
+def _build_scene_bvh(depsgraph):
+    """Build one world-space BVH over all visible evaluated geometry, or None if empty.
+
+    Vertex and triangle buffers are bulk-read with foreach_get and transformed
+    with NumPy in one pass. Per-vertex Python objects are still created, but
+    only once, by the final tolist() that BVHTree.FromPolygons consumes.
+    """
+    vert_chunks = []
+    tri_chunks = []
+    vert_offset = 0
+    for instance in depsgraph.object_instances:
+        obj = instance.object
+        if obj.type not in utils.GEOMETRY_OBJECT_TYPES:
+            continue
+        if not instance.is_instance and not obj.original.visible_get():
+            continue
+        # Evaluated mesh objects already carry their modified mesh as data;
+        # only other geometry types need a temporary to_mesh() copy.
+        owns_mesh = obj.type != 'MESH'
+        if owns_mesh:
+            try:
+                mesh = obj.to_mesh()
+            except RuntimeError:
+                continue
+        else:
+            mesh = obj.data
+        try:
+            if mesh is None:
+                continue
+            mesh.calc_loop_triangles()
+            vert_count = len(mesh.vertices)
+            tri_count = len(mesh.loop_triangles)
+            if not vert_count or not tri_count:
+                continue
+            
+            co = np.empty(vert_count * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", co)
+            matrix = np.array(instance.matrix_world, dtype=np.float32)
+            vert_chunks.append(co.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3])
+            
+            tri_indices = np.empty(tri_count * 3, dtype=np.int32)
+            mesh.loop_triangles.foreach_get("vertices", tri_indices)
+            tri_chunks.append(tri_indices.reshape(-1, 3) + vert_offset)
+            vert_offset += vert_count
+        finally:
+            if owns_mesh:
+                obj.to_mesh_clear()
+    if not tri_chunks:
+        return None
+    verts = np.concatenate(vert_chunks).tolist()
+    tris = np.concatenate(tri_chunks).tolist()
+    return BVHTree.FromPolygons(verts, tris, all_triangles=True)
+
+def _get_scene_bvh(depsgraph, token):
+    """Return the cached scene BVH for token, or _BVH_DEFERRED on its first use.
+
+    A one-off cast is cheaper through scene.ray_cast (Blender's native BVH,
+    nothing to build in Python), so the Python-side tree is only built once
+    the same geometry is cast against a second time.
+    """
+    if token not in _BVH_CACHE:
+        _BVH_CACHE.clear()
+        _BVH_CACHE[token] = _BVH_DEFERRED
+        return _BVH_DEFERRED
+    bvh = _BVH_CACHE[token]
+    if bvh is _BVH_DEFERRED:
+        bvh = _BVH_CACHE[token] = _build_scene_bvh(depsgraph)
+    return bvh
+
 class VIEW3D_OT_dolly_to_obstacle(bpy.types.Operator):
     """Move camera backward until it hits an obstacle (useful for maximizing view in tight spaces)"""
     bl_idname = "view3d.dolly_to_obstacle"
     bl_label = "Dolly to Obstacle"
     bl_options = {'REGISTER', 'UNDO'}
     
+    _last_hit = None  # (ray key, hit distance or None) from the previous raycast
+    
     offset: bpy.props.FloatProperty(
         name="Offset",
         description="Distance to keep from the obstacle",
@@ -659,25 +897,26 @@ class VIEW3D_OT_dolly_to_obstacle(bpy.types.Operator):
     @classmethod
     def poll(cls, context):
         # Available in 3D view (camera view or viewport)
-        if not context.space_data or context.space_data.type != 'VIEW_3D':
-            return False
-        return True
+        space = context.space_data
+        return space is not None and space.type == 'VIEW_3D'
     
     def execute(self, context):
         from mathutils import Vector
         
         space = context.space_data
         region = space.region_3d
+        cam = context.scene.camera
         
         # Determine if we're in camera view or viewport mode
-        in_camera_view = region.view_perspective == 'CAMERA' and context.scene.camera
+        in_camera_view = region.view_perspective == 'CAMERA' and cam
         
         if in_camera_view:
             # Camera mode: move the actual camera object
-            cam = context.scene.camera
-            cam_pos = cam.matrix_world.translation.copy()
+            matrix = cam.matrix_world
+            cam_pos = matrix.translation.copy()
             # Camera looks down its negative local Z, so backward is positive local Z
-            cam_backward = cam.matrix_world.to_3x3() @ Vector((0, 0, 1))
+            # (the matrix's third column; no 3x3 copy needed)
+            cam_backward = matrix.col[2].to_3d()
             cam_backward.normalize()
         else:
             # Viewport mode: move the viewport "eye" position
@@ -686,24 +925,26 @@ class VIEW3D_OT_dolly_to_obstacle(bpy.types.Operator):
             cam_backward = region.view_rotation @ Vector((0, 0, 1))
             cam_backward.normalize()
         
-        # Calculate max ray distance from scene bounding box (capped at 1km)
-        max_distance = self._get_scene_diagonal(context)
-        max_distance = min(max_distance, 1000.0)  # Cap at 1km
-        
-        # Use depsgraph for evaluated objects (visible meshes only)
+        # Use depsgraph for evaluated objects (visible meshes only).
+        # Getting it first also flushes pending updates into the geometry token.
         depsgraph = context.evaluated_depsgraph_get()
+        token = _scene_geometry_token(context)
         
-        # Raycast backward from camera/viewport
-        result, location, normal, index, obj, matrix = context.scene.ray_cast(
-            depsgraph,
-            cam_pos,
-            cam_backward,
-            distance=max_distance
+        # Repeat presses from an unchanged eye/direction reuse the last result
+        ray_key = (
+            token,
+            tuple(round(c, 4) for c in cam_pos),
+            tuple(round(c, 4) for c in cam_backward),
         )
+        last_hit = VIEW3D_OT_dolly_to_obstacle._last_hit
+        if last_hit is not None and last_hit[0] == ray_key:
+            hit_distance = last_hit[1]
+        else:
+            hit_distance = self._cast_backward(context, depsgraph, token, cam_pos, cam_backward, space.clip_end)
+            VIEW3D_OT_dolly_to_obstacle._last_hit = (ray_key, hit_distance)
         
-        if result:
+        if hit_distance is not None:
             # Calculate new position with offset
-            hit_distance = (location - cam_pos).length
             new_distance = hit_distance - self.offset
             
             if new_distance > 0:
@@ -714,10 +955,8 @@ class VIEW3D_OT_dolly_to_obstacle(bpy.types.Operator):
                 else:
                     # For viewport: compute new view_location from new eye position
                     # view_location = eye_position - (rotation @ view_z) * view_distance
-                    from mathutils import Vector
-                    view_z = Vector((0.0, 0.0, 1.0))
-                    offset = (region.view_rotation @ view_z) * region.view_distance
-                    region.view_location = new_pos - offset
+                    # (rotation @ view_z is cam_backward, already computed above)
+                    region.view_location = new_pos - cam_backward * region.view_distance
                 
                 self.report({'INFO'}, f"Moved back {new_distance:.2f} units to obstacle")
             else:
@@ -727,35 +966,72 @@ class VIEW3D_OT_dolly_to_obstacle(bpy.types.Operator):
         
         return {'FINISHED'}
     
-    def _get_scene_diagonal(self, context):
-        """Calculate the diagonal of the bounding box containing all visible mesh objects."""
-        from mathutils import Vector
+    def _cast_backward(self, context, depsgraph, token, cam_pos, cam_backward, clip_end):
+        """Raycast backward against the scene; return the hit distance or None.
+        
+        Starts with a short ray (half the view clip distance) and doubles it a
+        few times before falling back to the full scene diagonal, since the
+        obstacle behind the view is usually close.
+        """
+        # Calculate max ray distance from scene bounding box (capped at 1km).
+        # Bounds rarely change between clicks, so reuse the last result.
+        max_distance = _DIAGONAL_CACHE.get(token)
+        if max_distance is None:
+            max_distance = self._get_scene_diagonal(depsgraph)
+            _DIAGONAL_CACHE.clear()
+            _DIAGONAL_CACHE[token] = max_distance
+        max_distance = min(max_distance, 1000.0)  # Cap at 1km
         
-        min_corner = Vector((float('inf'), float('inf'), float('inf')))
-        max_corner = Vector((float('-inf'), float('-inf'), float('-inf')))
-        found_mesh = False
+        bvh = _get_scene_bvh(depsgraph, token)
+        if bvh is None:
+            return None
+        if bvh is _BVH_DEFERRED:
+            scene = context.scene
+            def cast(distance):
+                result, location, _normal, _index, _obj, _matrix = scene.ray_cast(
+                    depsgraph, cam_pos, cam_backward, distance=distance
+                )
+                return (location - cam_pos).length if result else None
+        else:
+            def cast(distance):
+                return bvh.ray_cast(cam_pos, cam_backward, distance)[3]
         
-        for obj in context.visible_objects:
+        distance = min(clip_end * 0.5, max_distance)
+        for _step in range(3):
+            if distance >= max_distance:
+                break
+            hit_distance = cast(distance)
+            if hit_distance is not None:
+                return hit_distance
+            distance *= 2.0
+        return cast(max_distance)
+    
+    def _get_scene_diagonal(self, depsgraph):
+        """Calculate the diagonal of the bounding box containing all visible mesh objects.
+        
+        Walks the evaluated depsgraph (the same one the raycast uses), so
+        modifiers and instances are included.
+        """
+        corner_sets = []
+        
+        for instance in depsgraph.object_instances:
+            obj = instance.object
             if obj.type != 'MESH':
                 continue
+            if not instance.is_instance and not obj.original.visible_get():
+                continue
             
-            found_mesh = True
-            # Get world-space bounding box corners
-            bbox_corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-            
-            for corner in bbox_corners:
-                min_corner.x = min(min_corner.x, corner.x)
-                min_corner.y = min(min_corner.y, corner.y)
-                min_corner.z = min(min_corner.z, corner.z)
-                max_corner.x = max(max_corner.x, corner.x)
-                max_corner.y = max(max_corner.y, corner.y)
-                max_corner.z = max(max_corner.z, corner.z)
-        
-        if not found_mesh:
+            # Get world-space bounding box corners (8x3) in one matrix product
+            matrix = np.array(instance.matrix_world)
+            corners = np.array(obj.bound_box)
+            corner_sets.append(corners @ matrix[:3, :3].T + matrix[:3, 3])
+        
+        if not corner_sets:
             return 100.0  # Default fallback
         
-        # Return diagonal length
-        return (max_corner - min_corner).length
+        # Reduce all corners at once and return the diagonal length
+        corners = np.concatenate(corner_sets)
+        return float(np.linalg.norm(corners.max(axis=0) - corners.min(axis=0)))
 
 # ========================================================================
 # SAVED VIEWS OPERATORS
@@ -772,12 +1048,35 @@ def _suppress_saved_view_enum_load():
     finally:
         controller.skip_enum_load = prev_skip
 
+# Exceptions tolerated by best-effort saved-view UI sync helpers
+_UI_SYNC_ERRORS = (ImportError, AttributeError, TypeError, ValueError, RuntimeError)
+
+# Exceptions tolerated when assigning a dynamic saved-view enum (no imports involved)
+_ENUM_ASSIGN_ERRORS = (AttributeError, TypeError, ValueError, RuntimeError)
+
+# Exceptions tolerated around thumbnail rendering (includes temp-file I/O)
+_THUMBNAIL_ERRORS = (RuntimeError, ReferenceError, AttributeError, TypeError, ValueError, OSError)
+
+def _reset_view_selection_state(context):
+    """Put the scene in "no view selected" state with enum loads suppressed."""
+    scene = context.scene
+    props = scene.viewpilot
+    with _suppress_saved_view_enum_load():
+        scene.saved_views_index = -1
+        if props.last_active_view_index != -1:
+            props.last_active_view_index = -1
+        props.saved_views_enum = 'NONE'
+        try:
+            props.panel_gallery_enum = 'NONE'
+        except _ENUM_ASSIGN_ERRORS:
+            pass
+
 def _set_panel_gallery_enum_safe(context, preferred_value=None):
     """Delegate to the canonical enum-safe setter in properties.py."""
     try:
         from .properties import _set_panel_gallery_enum_safe as _set_safe
         return _set_safe(context.scene.viewpilot, preferred_value)
-    except (ImportError, AttributeError, TypeError, ValueError, RuntimeError):
+    except _UI_SYNC_ERRORS:
         return False
 
 def _sync_saved_view_enums_safe(context, enum_value):
@@ -785,7 +1084,7 @@ def _sync_saved_view_enums_safe(context, enum_value):
     props = context.scene.viewpilot
     try:
         props.saved_views_enum = enum_value
-    except (AttributeError, TypeError, ValueError, RuntimeError):
+    except _ENUM_ASSIGN_ERRORS:
         pass
     _set_panel_gallery_enum_safe(context, enum_value)
 
@@ -794,25 +1093,184 @@ def _handle_storage_invalid(context, reporter, action_label="save view"):
     reporter.report({'ERROR'}, f"Can't {action_label}: ViewPilot storage is corrupted")
     try:
         bpy.ops.viewpilot.recover_storage_overwrite('INVOKE_DEFAULT', action_label=action_label)
-    except RuntimeError as error:
-        reporter.report({'WARNING'}, "Recovery dialog unavailable (see console)")
-    except (TypeError, AttributeError, ValueError) as error:
+    except (RuntimeError, TypeError, AttributeError, ValueError):
         reporter.report({'WARNING'}, "Recovery dialog unavailable (see console)")
 
-def _refresh_saved_views_ui(include_modal_gallery=True):
-    """Invalidate saved-view UI caches and optionally refresh modal gallery."""
+# Cache invalidators resolved in register() (after the reload pass, so they
+# never point at a stale module): full UI invalidation, then panel-only fallback.
+_invalidate_views_cb = None
+_invalidate_gallery_cb = None
+
+def _resolve_ui_invalidators():
+    """Bind the saved-view cache invalidation callables once."""
+    global _invalidate_views_cb, _invalidate_gallery_cb
     try:
         from .properties import invalidate_saved_views_ui_caches
-        invalidate_saved_views_ui_caches()
-    except (ImportError, AttributeError, TypeError, ValueError, RuntimeError) as error:
+        _invalidate_views_cb = invalidate_saved_views_ui_caches
+    except ImportError as error:
+        print(f"[ViewPilot] Saved-view UI cache invalidation unavailable: {error}")
+        _invalidate_views_cb = None
+    try:
+        from .preview_manager import invalidate_panel_gallery_cache
+        _invalidate_gallery_cb = invalidate_panel_gallery_cache
+    except ImportError as error:
+        print(f"[ViewPilot] Panel gallery cache invalidation unavailable: {error}")
+        _invalidate_gallery_cb = None
+
+def _refresh_saved_views_ui(include_modal_gallery=True):
+    """Invalidate saved-view UI caches and optionally refresh modal gallery."""
+    for invalidate in (_invalidate_views_cb, _invalidate_gallery_cb):
+        if invalidate is None:
+            continue
         try:
-            from .preview_manager import invalidate_panel_gallery_cache
-            invalidate_panel_gallery_cache()
-        except (ImportError, AttributeError, TypeError, ValueError, RuntimeError) as fallback_error:
-            pass
+            invalidate()
+            break
+        except _UI_SYNC_ERRORS:
+            continue
 
     if include_modal_gallery and VIEW3D_OT_thumbnail_gallery._is_active:
+        _schedule_gallery_refresh()
+
+# Modal gallery refresh is debounced so bursts of saves/deletes redraw once
+GALLERY_REFRESH_DELAY = 0.05
+_gallery_refresh_pending = False
+
+def _flush_gallery_refresh():
+    """Timer callback: forward one coalesced refresh to the modal gallery."""
+    global _gallery_refresh_pending
+    _gallery_refresh_pending = False
+    if VIEW3D_OT_thumbnail_gallery._is_active:
         VIEW3D_OT_thumbnail_gallery.request_refresh()
+    return None
+
+def _schedule_gallery_refresh():
+    """Request a modal gallery refresh, coalescing calls within GALLERY_REFRESH_DELAY."""
+    global _gallery_refresh_pending
+    if _gallery_refresh_pending:
+        return
+    _gallery_refresh_pending = True
+    bpy.app.timers.register(_flush_gallery_refresh, first_interval=GALLERY_REFRESH_DELAY)
+
+# Row selection in the reorder list can fire many times per frame while
+# dragging; only the latest index is synced to the dropdown/panel enums.
+ENUM_SYNC_DELAY = 0.016
+_pending_index_enum_sync = None  # (scene name, index) awaiting the timer
+
+def _flush_index_enum_sync():
+    """Timer callback: sync saved-view enums to the latest selected index."""
+    global _pending_index_enum_sync
+    pending = _pending_index_enum_sync
+    _pending_index_enum_sync = None
+    if pending is None:
+        return None
+    scene_name, index = pending
+    context = bpy.context
+    scene = getattr(context, "scene", None)
+    if scene is None or scene.name != scene_name:
+        return None
+    try:
+        with _suppress_saved_view_enum_load():
+            _sync_saved_view_enums_safe(context, str(index))
+    except _UI_SYNC_ERRORS as error:
+        print(f"[ViewPilot] Deferred enum sync failed: {error}")
+    return None
+
+def _schedule_index_enum_sync(scene, index):
+    """Request an enum sync for index, coalescing calls within ENUM_SYNC_DELAY."""
+    global _pending_index_enum_sync
+    was_pending = _pending_index_enum_sync is not None
+    _pending_index_enum_sync = (scene.name, index)
+    if not was_pending:
+        bpy.app.timers.register(_flush_index_enum_sync, first_interval=ENUM_SYNC_DELAY)
+
+# Reorder operators fire in bursts; their UI refresh runs once on the next tick
+_saved_views_ui_refresh_pending = False
+
+def _flush_saved_views_ui_refresh():
+    """Timer callback: run one coalesced saved-views UI refresh."""
+    global _saved_views_ui_refresh_pending
+    _saved_views_ui_refresh_pending = False
+    _refresh_saved_views_ui()
+    return None
+
+def _schedule_saved_views_ui_refresh():
+    """Request a saved-views UI refresh, coalescing calls until the next timer tick."""
+    global _saved_views_ui_refresh_pending
+    if _saved_views_ui_refresh_pending:
+        return
+    _saved_views_ui_refresh_pending = True
+    bpy.app.timers.register(_flush_saved_views_ui_refresh, first_interval=0.0)
+
+# (saved-view key, preference default) pairs applied to newly saved views
+_REMEMBER_KEYS = (
+    ("remember_perspective", "default_remember_perspective"),
+    ("remember_shading", "default_remember_shading"),
+    ("remember_overlays", "default_remember_overlays"),
+    ("remember_composition", "default_remember_composition"),
+)
+
+# Thumbnail image name -> _thumbnail_render_state() when it was rendered
+_thumbnail_render_states = {}
+
+# Tolerance for treating captured view floats as unchanged
+VIEW_STATE_EPSILON = 1e-6
+
+def _view_values_match(a, b):
+    """Compare stored view values, allowing float noise from the JSON round-trip."""
+    if isinstance(a, float) or isinstance(b, float):
+        try:
+            return math.isclose(a, b, rel_tol=VIEW_STATE_EPSILON, abs_tol=VIEW_STATE_EPSILON)
+        except TypeError:
+            return False
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(_view_values_match(x, y) for x, y in zip(a, b))
+    return a == b
+
+def _thumbnail_render_state(context):
+    """Key for what a thumbnail rendered now would show besides the view itself.
+    
+    utils.render_version covers object, collection, material, light, world
+    and node tree edits; the scene's World pointer covers assigning a
+    different World, which only shows up as an untracked Scene update.
+    """
+    world = context.scene.world
+    return (utils.render_version, world.as_pointer() if world else 0)
+
+def _saved_view_is_current(context, view_dict, existing_view):
+    """True when a fresh capture matches the stored view and its thumbnail.
+    
+    The thumbnail must still exist and have been rendered at the current
+    render state, so scene content edits still refresh it on update.
+    """
+    thumb_name = existing_view.get("thumbnail_image", "")
+    if not thumb_name or thumb_name not in bpy.data.images:
+        return False
+    if _thumbnail_render_states.get(thumb_name) != _thumbnail_render_state(context):
+        return False
+    for key, value in view_dict.items():
+        if key not in existing_view or not _view_values_match(value, existing_view[key]):
+            return False
+    return True
+
+def _generate_and_attach_thumbnail(context, view_dict, view_name, reporter, failure_message):
+    """Render a thumbnail for view_dict and store its image name in the dict.
+    
+    Returns the thumbnail image name, or None if generation failed (reported
+    as a warning through reporter).
+    """
+    try:
+        thumb_name = generate_thumbnail(context, view_dict, view_name)
+        if thumb_name:
+            view_dict["thumbnail_image"] = thumb_name
+            _thumbnail_render_states[thumb_name] = _thumbnail_render_state(context)
+        # Notify gallery to refresh if open
+        if VIEW3D_OT_thumbnail_gallery._is_active:
+            _schedule_gallery_refresh()
+        return thumb_name
+    except _THUMBNAIL_ERRORS:
+        reporter.report({'WARNING'}, failure_message)
+        traceback.print_exc()
+        return None
 
 class VIEWPILOT_OT_recover_storage_overwrite(bpy.types.Operator):
     """Overwrite corrupted ViewPilot storage with a fresh empty payload."""
@@ -823,21 +1281,17 @@ class VIEWPILOT_OT_recover_storage_overwrite(bpy.types.Operator):
     action_label: bpy.props.StringProperty(default="save view", options={'SKIP_SAVE'})
 
     def invoke(self, context, event):
-        wm = context.window_manager
-        try:
-            return wm.invoke_props_dialog(
-                self,
-                width=520,
-                title="ViewPilot Storage Error",
-                confirm_text="Overwrite",
-                cancel_default=True,
-            )
-        except TypeError:
-            return wm.invoke_props_dialog(self, width=520)
+        # title/confirm_text/cancel_default exist since Blender 4.1; the
+        # addon requires 4.2, so no fallback signature is needed.
+        return context.window_manager.invoke_props_dialog(
+            self,
+            width=520,
+            title="ViewPilot Storage Error",
+            confirm_text="Overwrite",
+            cancel_default=True,
+        )
 
     def draw(self, context):
-        from . import data_storage
-
         layout = self.layout
         layout.label(text=f"Can't {self.action_label} because JSON storage is corrupted.")
         layout.label(text="Overwrite ViewPilot storage and start from scratch?")
@@ -851,8 +1305,6 @@ class VIEWPILOT_OT_recover_storage_overwrite(bpy.types.Operator):
             layout.label(text=f"Details: {error_msg}")
 
     def execute(self, context):
-        from . import data_storage
-
         if not data_storage.force_reset_storage():
             self.report({'ERROR'}, "Failed to overwrite ViewPilot storage (see console)")
             return {'CANCELLED'}
@@ -874,12 +1326,9 @@ class VIEW3D_OT_save_current_view(bpy.types.Operator):
     
     @classmethod
     def poll(cls, context):
-        _, space, region = utils.find_view3d_context(context)
-        return bool(space and region)
+        return utils.has_view3d_context(context)
     
     def execute(self, context):
-        from . import data_storage
-        
         preferred_area = VIEW3D_OT_thumbnail_gallery._context_area
         _, space, region = utils.find_view3d_context(context, preferred_area=preferred_area)
         
@@ -900,41 +1349,24 @@ class VIEW3D_OT_save_current_view(bpy.types.Operator):
         # Apply default remember toggles from preferences
         try:
             prefs = get_preferences()
-            view_dict["remember_perspective"] = prefs.default_remember_perspective
-            view_dict["remember_shading"] = prefs.default_remember_shading
-            view_dict["remember_overlays"] = prefs.default_remember_overlays
-            view_dict["remember_composition"] = prefs.default_remember_composition
+            for view_key, pref_key in _REMEMBER_KEYS:
+                view_dict[view_key] = getattr(prefs, pref_key)
         except (AttributeError, RuntimeError, ValueError):
             pass  # Keep defaults from capture_viewport_as_dict
         
+        # Generate thumbnail first so the view is stored with it in one write
+        thumb_name = _generate_and_attach_thumbnail(
+            context, view_dict, view_name, self, "Thumbnail generation failed (see console)"
+        )
+        
         # Add to JSON storage (auto-syncs to PropertyGroup)
         new_index = data_storage.add_saved_view(view_dict)
         if new_index < 0:
+            if thumb_name:
+                delete_thumbnail(view_name)
             _handle_storage_invalid(context, self, "save view")
             return {'CANCELLED'}
         
-        # Generate thumbnail for this view
-        # Create a temporary PropertyGroup-like object for thumbnail generator
-        try:
-            from types import SimpleNamespace
-            temp_view = SimpleNamespace(**view_dict)
-            # Convert lists to tuples for compatibility
-            temp_view.location = tuple(view_dict["location"])
-            temp_view.rotation = tuple(view_dict["rotation"])
-            
-            thumb_name = generate_thumbnail(context, temp_view, view_name)
-            if thumb_name:
-                view_dict["thumbnail_image"] = thumb_name
-                if not data_storage.update_saved_view(new_index, view_dict):
-                    self.report({'WARNING'}, "Thumbnail saved in-memory but ViewPilot storage update was blocked")
-                
-            # Notify gallery to refresh if open
-            if VIEW3D_OT_thumbnail_gallery._is_active:
-                VIEW3D_OT_thumbnail_gallery.request_refresh()
-        except (RuntimeError, ReferenceError, AttributeError, TypeError, ValueError, OSError):
-            self.report({'WARNING'}, "Thumbnail generation failed (see console)")
-            traceback.print_exc()
-        
         # Set as active
         context.scene.saved_views_index = new_index
         
@@ -946,6 +1378,39 @@ class VIEW3D_OT_save_current_view(bpy.types.Operator):
         self.report({'INFO'}, f"Saved view: {view_name}")
         return {'FINISHED'}
 
+def _reinit_signature(context, space, region):
+    """Signature of everything reinitialize_from_context() reads, or None.
+    
+    None (always reinitialize) for camera view, whose values come from the
+    camera object, and when reinit would resolve a different 3D View.
+    """
+    if context.space_data != space or region.view_perspective == 'CAMERA':
+        return None
+    scene = context.scene
+    camera = scene.camera
+    return (
+        scene.as_pointer(),
+        space.as_pointer(),
+        camera.as_pointer() if camera else 0,
+        scene.saved_views_index,
+        region.view_perspective,
+        tuple(region.view_location),
+        tuple(region.view_rotation),
+        region.view_distance,
+        space.lens,
+        space.clip_start,
+        space.clip_end,
+    )
+
+def _panel_offsets_clear(props):
+    """True when the relative panel controls reinit would reset are already zero."""
+    return (
+        props.zoom_level == 0.0
+        and props.screen_x == 0.0
+        and props.screen_z == 0.0
+        and props.screen_rotation == 0.0
+    )
+
 class VIEW3D_OT_load_saved_view(bpy.types.Operator):
     """Load the selected saved view"""
     bl_idname = "view3d.load_saved_view"
@@ -954,14 +1419,11 @@ class VIEW3D_OT_load_saved_view(bpy.types.Operator):
     
     @classmethod
     def poll(cls, context):
-        from . import data_storage
-        views = data_storage.get_saved_views()
-        _, space, region = utils.find_view3d_context(context)
-        return bool(space and region and len(views) > 0 and context.scene.saved_views_index >= 0)
+        if context.scene.saved_views_index < 0 or not data_storage.has_saved_views():
+            return False
+        return utils.has_view3d_context(context)
     
     def execute(self, context):
-        from . import data_storage
-
         preferred_area = VIEW3D_OT_thumbnail_gallery._context_area
         _, space, region = utils.find_view3d_context(context, preferred_area=preferred_area)
         if not space or not region:
@@ -981,11 +1443,18 @@ class VIEW3D_OT_load_saved_view(bpy.types.Operator):
         # Lock history recording briefly using StateController
         get_controller().start_grace_period(0.5, UpdateSource.VIEW_RESTORE)
         
-        # Sync properties to new view
-        context.scene.viewpilot.reinitialize_from_context(context)
+        # Sync properties to new view (skipped when reloading a view the
+        # panel was already initialized from)
+        props = context.scene.viewpilot
+        signature = _reinit_signature(context, space, region)
+        if signature is None or signature != utils.reinit_signature or not _panel_offsets_clear(props):
+            props.reinitialize_from_context(context)
+            # Recorded after the reinit, which clears it for every other caller
+            utils.reinit_signature = signature
         
         # Reset ghost tracking
-        context.scene.viewpilot.last_active_view_index = -1
+        if props.last_active_view_index != -1:
+            props.last_active_view_index = -1
         
         self.report({'INFO'}, f"Loaded view: {view_dict.get('name', 'View')}")
         return {'FINISHED'}
@@ -1001,13 +1470,9 @@ class VIEW3D_OT_delete_saved_view(bpy.types.Operator):
     
     @classmethod
     def poll(cls, context):
-        from . import data_storage
-        views = data_storage.get_saved_views()
-        return len(views) > 0
+        return data_storage.has_saved_views()
     
     def execute(self, context):
-        from . import data_storage
-        
         # Use index property if set, otherwise use saved_views_index
         index = self.index if self.index >= 0 else context.scene.saved_views_index
         view_dict = data_storage.get_saved_view(index)
@@ -1018,19 +1483,12 @@ class VIEW3D_OT_delete_saved_view(bpy.types.Operator):
         
         view_name = view_dict.get("name", "View")
         
-        # Delete associated thumbnail
-        delete_thumbnail(view_name)
+        # Delete associated thumbnail (panel caches are refreshed below)
+        delete_thumbnail(view_name, invalidate_cache=False)
 
         # Pre-clear dynamic enum selections so they never reference a soon-to-be
         # invalid index while sync_to_all_scenes updates the backing collection.
-        with _suppress_saved_view_enum_load():
-            context.scene.saved_views_index = -1
-            context.scene.viewpilot.last_active_view_index = -1
-            context.scene.viewpilot.saved_views_enum = 'NONE'
-            try:
-                context.scene.viewpilot.panel_gallery_enum = 'NONE'
-            except (TypeError, ValueError, RuntimeError, AttributeError):
-                pass
+        _reset_view_selection_state(context)
         
         # Remove the view from JSON storage (auto-syncs to PropertyGroup)
         if not data_storage.delete_saved_view(index):
@@ -1042,20 +1500,17 @@ class VIEW3D_OT_delete_saved_view(bpy.types.Operator):
         
         # Deletion intentionally leaves the addon in "no view selected" state.
         # This avoids implying we're on another saved view when viewport state
-        # has not been loaded from it.
-        with _suppress_saved_view_enum_load():
-            context.scene.saved_views_index = -1
-            context.scene.viewpilot.last_active_view_index = -1
-            context.scene.viewpilot.saved_views_enum = 'NONE'
-            try:
-                context.scene.viewpilot.panel_gallery_enum = 'NONE'
-            except (TypeError, ValueError, RuntimeError, AttributeError):
-                pass
+        # has not been loaded from it. The pre-clear above already set it, so
+        # only repeat the writes if the sync moved the index.
+        if context.scene.saved_views_index != -1:
+            _reset_view_selection_state(context)
         
         self.report({'INFO'}, f"Deleted view: {view_name}")
         
-        # Clean up World fake users that may no longer be needed
-        utils.cleanup_world_fake_users()
+        # Clean up World fake users that may no longer be needed. Only a view
+        # that referenced a World can leave one unreferenced.
+        if view_dict.get("shading_selected_world"):
+            utils.cleanup_world_fake_users()
         
         return {'FINISHED'}
 
@@ -1070,20 +1525,13 @@ class VIEW3D_OT_update_saved_view(bpy.types.Operator):
     
     @classmethod
     def poll(cls, context):
-        from . import data_storage
-        _, space, region = utils.find_view3d_context(context)
-        has_view3d = bool(space and region)
-        
-        views = data_storage.get_saved_views()
-        if not has_view3d or len(views) == 0:
+        # Always enable if there are saved views (execute handles fallback).
+        # Check the cached count before the heavier VIEW_3D lookup.
+        if not data_storage.has_saved_views():
             return False
-            
-        # Always enable if there are saved views (execute handles fallback)
-        return True
+        return utils.has_view3d_context(context)
     
     def execute(self, context):
-        from . import data_storage
-        
         preferred_area = VIEW3D_OT_thumbnail_gallery._context_area
         _, space, region = utils.find_view3d_context(context, preferred_area=preferred_area)
         
@@ -1119,27 +1567,18 @@ class VIEW3D_OT_update_saved_view(bpy.types.Operator):
         view_dict["remember_overlays"] = existing_view.get("remember_overlays", True)
         view_dict["remember_composition"] = existing_view.get("remember_composition", True)
         
-        # Regenerate thumbnail with new view
-        try:
-            from types import SimpleNamespace
-            temp_view = SimpleNamespace(**view_dict)
-            temp_view.location = tuple(view_dict["location"])
-            temp_view.rotation = tuple(view_dict["rotation"])
+        # Nothing changed since the last capture: skip the render and the write
+        unchanged = _saved_view_is_current(context, view_dict, existing_view)
+        if not unchanged:
+            # Regenerate thumbnail with new view
+            _generate_and_attach_thumbnail(
+                context, view_dict, view_name, self, "Thumbnail regeneration failed (see console)"
+            )
             
-            thumb_name = generate_thumbnail(context, temp_view, view_name)
-            if thumb_name:
-                view_dict["thumbnail_image"] = thumb_name
-            # Notify gallery to refresh if open
-            if VIEW3D_OT_thumbnail_gallery._is_active:
-                VIEW3D_OT_thumbnail_gallery.request_refresh()
-        except (RuntimeError, ReferenceError, AttributeError, TypeError, ValueError, OSError):
-            self.report({'WARNING'}, "Thumbnail regeneration failed (see console)")
-            traceback.print_exc()
-        
-        # Update in JSON storage
-        if not data_storage.update_saved_view(index, view_dict):
-            _handle_storage_invalid(context, self, "update view")
-            return {'CANCELLED'}
+            # Update in JSON storage
+            if not data_storage.update_saved_view(index, view_dict):
+                _handle_storage_invalid(context, self, "update view")
+                return {'CANCELLED'}
         
         # Clear modified flag and snap back to the view (it's now cleanly matched)
         params = context.scene.viewpilot
@@ -1151,7 +1590,10 @@ class VIEW3D_OT_update_saved_view(bpy.types.Operator):
         with _suppress_saved_view_enum_load():
             _sync_saved_view_enums_safe(context, str(index))
         
-        self.report({'INFO'}, f"Updated view: {view_name}")
+        if unchanged:
+            self.report({'INFO'}, f"View already up to date: {view_name}")
+        else:
+            self.report({'INFO'}, f"Updated view: {view_name}")
         return {'FINISHED'}
 
 class VIEW3D_OT_rename_saved_view(bpy.types.Operator):
@@ -1183,12 +1625,11 @@ class VIEW3D_OT_rename_saved_view(bpy.types.Operator):
         old_cam_name = f"{prefix} [{old_name}]"
         new_cam_name = f"{prefix} [{new_name}]"
 
-        for obj in bpy.data.objects:
-            if obj.type == 'CAMERA' and obj.name == old_cam_name:
-                obj.name = new_cam_name
-                if obj.data:
-                    obj.data.name = new_cam_name
-                break
+        obj = bpy.data.objects.get(old_cam_name)
+        if obj is not None and obj.type == 'CAMERA':
+            obj.name = new_cam_name
+            if obj.data:
+                obj.data.name = new_cam_name
 
     new_name: bpy.props.StringProperty(
         name="New Name",
@@ -1210,11 +1651,9 @@ class VIEW3D_OT_rename_saved_view(bpy.types.Operator):
         # BUT this breaks the modal gallery context menu item which calls this operator 
         # on an unselected view.
         # The correct fix: Be permissive here (just len > 0), and let UI layout. enabled handle the button state for the panel.
-        from . import data_storage
-        return len(data_storage.get_saved_views()) > 0
+        return data_storage.has_saved_views()
     
     def invoke(self, context, event):
-        from . import data_storage
         views = data_storage.get_saved_views()
         idx = self.get_target_index(context)
         if 0 <= idx < len(views):
@@ -1227,15 +1666,14 @@ class VIEW3D_OT_rename_saved_view(bpy.types.Operator):
         row.prop(self, "new_name", text="")
     
     def execute(self, context):
-        from . import data_storage
-
         views = data_storage.get_saved_views()
         idx = self.get_target_index(context)
         if not (0 <= idx < len(views)):
             self.report({'WARNING'}, "No saved view selected")
             return {'CANCELLED'}
 
-        view_dict = views[idx]
+        # Copy: the cached entry must keep the old name unless the save succeeds
+        view_dict = dict(views[idx])
         old_name = view_dict.get("name", "View")
         new_name = self.new_name.strip()
 
@@ -1266,25 +1704,26 @@ class VIEW3D_OT_prev_saved_view(bpy.types.Operator):
     
     @classmethod
     def poll(cls, context):
-        from . import data_storage
-        return len(data_storage.get_saved_views()) > 0
+        return data_storage.has_saved_views()
     
     def execute(self, context):
-        from . import data_storage
         views = data_storage.get_saved_views()
         current_index = context.scene.saved_views_index
         
-        # Go to previous, wrap around
-        new_index = current_index - 1
-        if new_index < 0:
-            new_index = len(views) - 1
+        view_count = len(views)
+        
+        # Go to previous, wrap around (no selection starts from the last view)
+        if current_index < 0:
+            new_index = view_count - 1
+        else:
+            new_index = (current_index - 1) % view_count
 
         # Trigger normal enum callback path so the viewport actually loads.
         context.scene.viewpilot.saved_views_enum = str(new_index)
         
         # Report which view we're on
         view_name = views[new_index].get("name", "View")
-        self.report({'INFO'}, f"< {view_name} ({new_index + 1}/{len(views)})")
+        self.report({'INFO'}, f"< {view_name} ({new_index + 1}/{view_count})")
         
         return {'FINISHED'}
 
@@ -1296,25 +1735,23 @@ class VIEW3D_OT_next_saved_view(bpy.types.Operator):
     
     @classmethod
     def poll(cls, context):
-        from . import data_storage
-        return len(data_storage.get_saved_views()) > 0
+        return data_storage.has_saved_views()
     
     def execute(self, context):
-        from . import data_storage
         views = data_storage.get_saved_views()
         current_index = context.scene.saved_views_index
         
+        view_count = len(views)
+        
         # Go to next, wrap around
-        new_index = current_index + 1
-        if new_index >= len(views):
-            new_index = 0
+        new_index = (current_index + 1) % view_count
 
         # Trigger normal enum callback path so the viewport actually loads.
         context.scene.viewpilot.saved_views_enum = str(new_index)
         
         # Report which view we're on
         view_name = views[new_index].get("name", "View")
-        self.report({'INFO'}, f"> {view_name} ({new_index + 1}/{len(views)})")
+        self.report({'INFO'}, f"> {view_name} ({new_index + 1}/{view_count})")
         
         return {'FINISHED'}
 
@@ -1331,64 +1768,136 @@ class VIEW3D_OT_set_saved_views_index(bpy.types.Operator):
     index: bpy.props.IntProperty(default=-1)
     
     def execute(self, context):
-        # Set index without triggering view load
+        # Set index without triggering view load; the enum sync is debounced
         with _suppress_saved_view_enum_load():
             context.scene.saved_views_index = self.index
-            _sync_saved_view_enums_safe(context, str(self.index))
+        _schedule_index_enum_sync(context.scene, self.index)
         
         return {'FINISHED'}
 
 class VIEWPILOT_UL_saved_views_reorder(bpy.types.UIList):
     """UIList for reordering saved views with drag-and-drop."""
 
-    def _get_icon_map(self, context):
-        """Build/reuse icon cache for current saved view ordering."""
-        views = getattr(context.scene, "saved_views", [])
-        signature = tuple((view.name, view.thumbnail_image) for view in views)
+    # Saved-views list fetched by the owning popup's draw() for this redraw
+    _draw_source = None
 
-        cached_sig = getattr(self, "_icon_cache_signature", None)
-        cached_map = getattr(self, "_icon_cache_map", None)
-        if cached_sig == signature and cached_map is not None:
-            return cached_map
+    # Icon cache as (source, signature, icon_map), filled per instance on first use
+    _icon_cache = None
+
+    # filter_items() result and the key it was computed for
+    _filter_cache_key = None
+    _filter_cache = None
+
+    def _get_icon_map(self, context):
+        """Build/reuse icon cache for current saved view ordering.
+        
+        Called once per drawn row, so the cache check must stay O(1). The
+        parsed saved-views list from data_storage is replaced whenever the
+        stored views change (save, rename, reorder, undo), so its identity
+        plus the row count and scene serve as the signature, together with
+        the preview id version so lazily loaded previews replace the zero
+        icons of the first draw. The popup's draw() hands that list over via
+        _draw_source before template_list.
+        """
+        scene = context.scene
+        views = getattr(scene, "saved_views", [])
+        source = VIEWPILOT_UL_saved_views_reorder._draw_source
+        if source is None:
+            source = data_storage.get_saved_views()
+        signature = (scene.as_pointer(), len(views), preview_manager._preview_ids_version)
+
+        cache = self._icon_cache
+        if cache is not None and cache[0] is source and cache[1] == signature:
+            return cache[2]
 
-        icon_map = {}
         try:
-            from .preview_manager import get_view_icon_id_fast
-            for idx, view in enumerate(views):
-                icon_map[idx] = get_view_icon_id_fast(view.name, view.thumbnail_image)
-        except (ImportError, AttributeError, RuntimeError, ReferenceError, ValueError) as error:
+            get_view_icon_id_fast = preview_manager.get_view_icon_id_fast
+            icon_map = {
+                idx: get_view_icon_id_fast(view.name, view.thumbnail_image)
+                for idx, view in enumerate(views)
+            }
+        except (AttributeError, RuntimeError, ReferenceError, ValueError):
             icon_map = {}
 
-        self._icon_cache_signature = signature
-        self._icon_cache_map = icon_map
+        self._icon_cache = (source, signature, icon_map)
         return icon_map
     
+    def filter_items(self, context, data, propname):
+        """Filter/sort rows, reusing the last result while nothing changed.
+        
+        Keyed like the icon cache (saved-views list identity and row count)
+        plus the list's own filter settings, so an unchanged popup skips the
+        per-row name filtering Blender would otherwise redo on every redraw.
+        """
+        items = getattr(data, propname)
+        source = VIEWPILOT_UL_saved_views_reorder._draw_source
+        if source is None:
+            source = data_storage.get_saved_views()
+        key = (
+            source,
+            len(items),
+            self.filter_name,
+            self.use_filter_invert,
+            self.use_filter_sort_alpha,
+            self.use_filter_sort_reverse,
+        )
+
+        cached_key = self._filter_cache_key
+        if (
+            cached_key is not None
+            and cached_key[0] is source
+            and cached_key[1:] == key[1:]
+        ):
+            return self._filter_cache
+
+        helper = bpy.types.UI_UL_list
+        if self.filter_name:
+            flt_flags = helper.filter_items_by_name(
+                self.filter_name, self.bitflag_filter_item, items, "name",
+                reverse=self.use_filter_invert,
+            )
+        else:
+            flt_flags = [self.bitflag_filter_item] * len(items)
+        flt_neworder = helper.sort_items_by_name(items, "name") if self.use_filter_sort_alpha else []
+
+        self._filter_cache_key = key
+        self._filter_cache = (flt_flags, flt_neworder)
+        return self._filter_cache
+
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
-        view = item
-        if self.layout_type in {'DEFAULT', 'COMPACT'}:
-            # Main row with split for label and buttons
-            row = layout.row(align=True)
-            
-            # Try to get thumbnail icon from cached map.
-            icon_id = self._get_icon_map(context).get(index, 0)
-            
-            # View name with icon (takes most of the space)
-            if icon_id:
-                row.label(text=view.name, icon_value=icon_id)
-            else:
-                row.label(text=view.name, icon='BOOKMARKS')
-            
-            # Rename button
-            op_rename = row.operator("view3d.rename_saved_view", text="", icon='FONT_DATA', emboss=False)
-            op_rename.index = index
-            
-            # Delete button
-            op_delete = row.operator("view3d.delete_saved_view", text="", icon='X', emboss=False)
-            op_delete.index = index
-            
-        elif self.layout_type == 'GRID':
-            layout.alignment = 'CENTER'
-            layout.label(text="", icon='BOOKMARKS')
+        # The popup always uses the list layout, so test the rare GRID case
+        # with one string compare instead of a per-row set lookup.
+        if self.layout_type == 'GRID':
+            self._draw_grid(layout)
+        else:
+            self._draw_default(context, layout, item, index)
+
+    def _draw_default(self, context, layout, view, index):
+        """Draw one row for the DEFAULT/COMPACT layouts."""
+        # Main row with split for label and buttons
+        row = layout.row(align=True)
+        
+        # Try to get thumbnail icon from cached map.
+        icon_id = self._get_icon_map(context).get(index, 0)
+        
+        # View name with icon (takes most of the space)
+        if icon_id:
+            row.label(text=view.name, icon_value=icon_id)
+        else:
+            row.label(text=view.name, icon='BOOKMARKS')
+        
+        # Rename button
+        op_rename = row.operator("view3d.rename_saved_view", text="", icon='FONT_DATA', emboss=False)
+        op_rename.index = index
+        
+        # Delete button
+        op_delete = row.operator("view3d.delete_saved_view", text="", icon='X', emboss=False)
+        op_delete.index = index
+
+    def _draw_grid(self, layout):
+        """Draw one cell for the GRID layout."""
+        layout.alignment = 'CENTER'
+        layout.label(text="", icon='BOOKMARKS')
 
 class VIEW3D_OT_reorder_views(bpy.types.Operator):
     """Open a popup to reorder saved views via drag-and-drop"""
@@ -1398,19 +1907,17 @@ class VIEW3D_OT_reorder_views(bpy.types.Operator):
     
     @classmethod
     def poll(cls, context):
-        from . import data_storage
-        return len(data_storage.get_saved_views()) > 1
+        return data_storage.get_saved_views_count() > 1
     
     def invoke(self, context, event):
         return context.window_manager.invoke_popup(self, width=300)
     
     def draw(self, context):
-        from . import data_storage
-        
         layout = self.layout
         layout.label(text="Use buttons to reorder:", icon='SORTSIZE')
         
         views = data_storage.get_saved_views()
+        VIEWPILOT_UL_saved_views_reorder._draw_source = views
         
         # UIList with built-in drag-and-drop
         row = layout.row()
@@ -1428,7 +1935,7 @@ class VIEW3D_OT_reorder_views(bpy.types.Operator):
     
     def execute(self, context):
         # Refresh galleries after reordering.
-        _refresh_saved_views_ui()
+        _schedule_saved_views_ui_refresh()
         return {'FINISHED'}
 
 class VIEW3D_OT_move_view_up(bpy.types.Operator):
@@ -1439,40 +1946,28 @@ class VIEW3D_OT_move_view_up(bpy.types.Operator):
     
     @classmethod
     def poll(cls, context):
-        from . import data_storage
-        views = data_storage.get_saved_views()
-        return (len(views) > 1 and 
+        return (data_storage.get_saved_views_count() > 1 and 
                 context.scene.saved_views_index > 0)
     
     def execute(self, context):
-        from . import data_storage
-        
         views = data_storage.get_saved_views()
         idx = context.scene.saved_views_index
         
         if idx > 0 and idx < len(views):
-            # Swap the views in JSON storage
-            views[idx], views[idx - 1] = views[idx - 1], views[idx]
+            # Update index to follow the moved view
+            new_index = idx - 1
             
-            # Save the reordered list
-            data = data_storage.load_data()
-            data["saved_views"] = views
-            if not data_storage.save_data(data):
+            # Move in JSON storage (also reorders PropertyGroups so UIList updates)
+            if not data_storage.move_saved_view(idx, new_index):
                 _handle_storage_invalid(context, self, "reorder views")
                 return {'CANCELLED'}
             
-            # Sync to PropertyGroup so UIList updates
-            data_storage.sync_to_all_scenes()
-            
-            # Update index to follow the moved view
-            new_index = idx - 1
-            
             with _suppress_saved_view_enum_load():
                 context.scene.saved_views_index = new_index
                 _sync_saved_view_enums_safe(context, str(new_index))
             
             # Refresh galleries.
-            _refresh_saved_views_ui()
+            _schedule_saved_views_ui_refresh()
         
         return {'FINISHED'}
 
@@ -1484,40 +1979,29 @@ class VIEW3D_OT_move_view_down(bpy.types.Operator):
     
     @classmethod
     def poll(cls, context):
-        from . import data_storage
-        views = data_storage.get_saved_views()
-        return (len(views) > 1 and 
-                context.scene.saved_views_index < len(views) - 1)
+        count = data_storage.get_saved_views_count()
+        return (count > 1 and 
+                context.scene.saved_views_index < count - 1)
     
     def execute(self, context):
-        from . import data_storage
-        
         views = data_storage.get_saved_views()
         idx = context.scene.saved_views_index
         
         if idx >= 0 and idx < len(views) - 1:
-            # Swap the views in JSON storage
-            views[idx], views[idx + 1] = views[idx + 1], views[idx]
+            # Update index to follow the moved view
+            new_index = idx + 1
             
-            # Save the reordered list
-            data = data_storage.load_data()
-            data["saved_views"] = views
-            if not data_storage.save_data(data):
+            # Move in JSON storage (also reorders PropertyGroups so UIList updates)
+            if not data_storage.move_saved_view(idx, new_index):
                 _handle_storage_invalid(context, self, "reorder views")
                 return {'CANCELLED'}
             
-            # Sync to PropertyGroup so UIList updates
-            data_storage.sync_to_all_scenes()
-            
-            # Update index to follow the moved view
-            new_index = idx + 1
-            
             with _suppress_saved_view_enum_load():
                 context.scene.saved_views_index = new_index
                 _sync_saved_view_enums_safe(context, str(new_index))
             
             # Refresh galleries.
-            _refresh_saved_views_ui()
+            _schedule_saved_views_ui_refresh()
         
         return {'FINISHED'}
 
@@ -1551,11 +2035,42 @@ classes = (
     VIEW3D_OT_move_view_down,
 )
 
+@persistent
+def _clear_dolly_caches(_dummy=None):
+    """Drop dolly raycast caches (load_post handler).
+
+    Their tokens use names and utils.geometry_version, which can repeat in
+    another file.
+    """
+    _BVH_CACHE.clear()
+    _DIAGONAL_CACHE.clear()
+    VIEW3D_OT_dolly_to_obstacle._last_hit = None
+
 def register():
+    _resolve_ui_invalidators()
     for cls in classes:
         bpy.utils.register_class(cls)
+    if _clear_dolly_caches not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_clear_dolly_caches)
 
 def unregister():
+    global _gallery_refresh_pending, _saved_views_ui_refresh_pending, _pending_index_enum_sync
+    global _invalidate_views_cb, _invalidate_gallery_cb
+    if _clear_dolly_caches in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_clear_dolly_caches)
+    _clear_dolly_caches()
+    if bpy.app.timers.is_registered(_flush_gallery_refresh):
+        bpy.app.timers.unregister(_flush_gallery_refresh)
+    _gallery_refresh_pending = False
+    if bpy.app.timers.is_registered(_flush_saved_views_ui_refresh):
+        bpy.app.timers.unregister(_flush_saved_views_ui_refresh)
+    _saved_views_ui_refresh_pending = False
+    if bpy.app.timers.is_registered(_flush_index_enum_sync):
+        bpy.app.timers.unregister(_flush_index_enum_sync)
+    _pending_index_enum_sync = None
+    _invalidate_views_cb = None
+    _invalidate_gallery_cb = None
+
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
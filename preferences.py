@@ -3,45 +3,151 @@ Preferences and Property Groups for ViewPilot.
 """
 
 import bpy
+from bpy.app.handlers import persistent
+
+_tagged_collections_cache = []   # [(scene, collection)] of ViewPilot camera collections
+_tagged_collections_key = None   # (utils.collection_version, scene count, collection count)
+_last_applied_collection = {"name": None, "color": None}  # last values pushed to tagged collections
 
 # ============================================================================
 # PREFERENCE UPDATE CALLBACKS
 # ============================================================================
 
-def _iter_viewpilot_camera_collections():
-    """Yield (scene, collection) pairs for all ViewPilot-tagged camera collections."""
+def _collect_viewpilot_camera_collections():
+    """Walk every scene's collection tree for ViewPilot-tagged camera collections."""
+    found = []
     seen = set()
-
-    def _walk(scene, parent):
-        for child in parent.children:
+    for scene in bpy.data.scenes:
+        stack = list(scene.collection.children)
+        while stack:
+            child = stack.pop()
             if child.get("is_viewport_cameras_collection"):
                 ptr = child.as_pointer()
                 if ptr not in seen:
                     seen.add(ptr)
-                    yield (scene, child)
-            yield from _walk(scene, child)
+                    found.append((scene, child))
+            stack.extend(child.children)
+    return found
+
+
+def _iter_viewpilot_camera_collections():
+    """Yield (scene, collection) pairs for all ViewPilot-tagged camera collections.
+    
+    The tree walk is cached until a scene/collection depsgraph update (or a
+    change in scene/collection count) invalidates it, so slider-driven
+    name/color updates don't re-walk every scene.
+    """
+    global _tagged_collections_cache, _tagged_collections_key
+    from . import utils
+    key = (utils.collection_version, len(bpy.data.scenes), len(bpy.data.collections))
+    if key != _tagged_collections_key:
+        _tagged_collections_cache = _collect_viewpilot_camera_collections()
+        _tagged_collections_key = key
+    return iter(_tagged_collections_cache)
+
+
+def update_settle_delay(self, context):
+    """Drop the history monitor's cached settle delay so the new value is used."""
+    from . import utils
+    utils.settle_delay_cache = None
 
-    for scene in bpy.data.scenes:
-        yield from _walk(scene, scene.collection)
+
+def update_section_visibility(self, context):
+    """Drop the panel's cached section visibility so the new toggles are used."""
+    from . import utils
+    utils.section_visibility_cache = {}
 
 
 def update_collection_name(self, context):
     """Update existing viewport cameras collection name when preference changes."""
+    name = self.camera_collection_name
+    if _last_applied_collection["name"] == name:
+        return
+    _last_applied_collection["name"] = name
     for scene, coll in _iter_viewpilot_camera_collections():
-        coll["viewpilot_base_name"] = self.camera_collection_name
-        coll.name = f"{self.camera_collection_name} [{scene.name}]"
+        coll["viewpilot_base_name"] = name
+        coll.name = f"{name} [{scene.name}]"
 
 
 def update_collection_color(self, context):
     """Update existing viewport cameras collection color when preference changes."""
+    color = self.camera_collection_color
+    if _last_applied_collection["color"] == color:
+        return
+    _last_applied_collection["color"] = color
     for _scene, coll in _iter_viewpilot_camera_collections():
-        coll.color_tag = self.camera_collection_color
+        coll.color_tag = color
 
 
 # ============================================================================
 # ADDON PREFERENCES
 # ============================================================================
 
+# Operators listed in the preferences' keyboard shortcut section, in display order
+_SHORTCUT_ORDER = (
+    ("view3d.viewport_controls", "Open Popup"),
+    ("view3d.view_history_back", "History Back"),
+    ("view3d.view_history_forward", "History Forward"),
+    ("view3d.prev_saved_view", "Previous View"),
+    ("view3d.next_saved_view", "Next View"),
+)
+_SHORTCUT_IDNAMES = frozenset(idname for idname, _label in _SHORTCUT_ORDER)
+
+# Panel sections as (key, label, description, viewport default, camera default);
+# each gets a section_show_<key> / section_show_<key>_cam BoolProperty pair
+_SECTION_VISIBILITY_DEFAULTS = (
+    ("history", "History", "", True, False),
+    ("lens", "Lens", "", True, True),
+    ("transform", "Transform", "", True, True),
+    ("saved_views", "Views", "", True, False),
+    ("overlays", "Camera Overlays", "Only relevant in camera view", False, True),
+)
+
+
+def _section_visibility_annotations():
+    """Build the section visibility BoolProperty annotations."""
+    annotations = {}
+    for key, label, description, default, cam_default in _SECTION_VISIBILITY_DEFAULTS:
+        annotations[f"section_show_{key}"] = bpy.props.BoolProperty(
+            name=label, description=description, default=default,
+            update=update_section_visibility,
+        )
+        annotations[f"section_show_{key}_cam"] = bpy.props.BoolProperty(
+            name="", description="Show in camera view", default=cam_default,
+            update=update_section_visibility,
+        )
+    return annotations
+
+# Static row tables for the preferences layout (viewport/camera toggle pairs,
+# "Label: value" gallery rows, remember-toggle defaults)
+_SECTION_TOGGLE_ROWS = (
+    ("section_show_history", "section_show_history_cam"),
+    ("section_show_lens", "section_show_lens_cam"),
+    ("section_show_transform", "section_show_transform_cam"),
+    ("section_show_saved_views", "section_show_saved_views_cam"),
+)
+_GALLERY_SETTING_ROWS = (
+    ("Thumbnail Size:", "thumbnail_size_max"),
+    ("Texture Cache Size:", "texture_cache_max"),
+    ("MMB Big Preview Size:", "preview_size_factor"),
+    ("MMB Big Preview Backdrop:", "preview_backdrop_opacity"),
+)
+_REMEMBER_DEFAULT_PROPS = (
+    "default_remember_perspective",
+    "default_remember_shading",
+    "default_remember_overlays",
+    "default_remember_composition",
+)
+
+def _draw_labeled_prop(layout, prefs, label, prop_name, text=""):
+    """Draw a half/half "Label: [value]" row (text=None keeps the prop's own label)."""
+    split_row = layout.row(align=True).split(factor=0.5)
+    split_row.label(text=label)
+    if text is None:
+        split_row.prop(prefs, prop_name, expand=False)
+    else:
+        split_row.prop(prefs, prop_name, text=text)
+
 class ViewportCameraControlsPreferences(bpy.types.AddonPreferences):
     bl_idname = __package__
     
@@ -81,16 +187,8 @@ class ViewportCameraControlsPreferences(bpy.types.AddonPreferences):
     
     # Shared Panel Section Visibility (used by all panels: popup, N-panel, header)
     # Each section has a toggle for viewport mode and camera mode
-    section_show_history: bpy.props.BoolProperty(name="History", default=True)
-    section_show_history_cam: bpy.props.BoolProperty(name="", description="Show in camera view", default=False)
-    section_show_lens: bpy.props.BoolProperty(name="Lens", default=True)
-    section_show_lens_cam: bpy.props.BoolProperty(name="", description="Show in camera view", default=True)
-    section_show_transform: bpy.props.BoolProperty(name="Transform", default=True)
-    section_show_transform_cam: bpy.props.BoolProperty(name="", description="Show in camera view", default=True)
-    section_show_saved_views: bpy.props.BoolProperty(name="Views", default=True)
-    section_show_saved_views_cam: bpy.props.BoolProperty(name="", description="Show in camera view", default=False)
-    section_show_overlays: bpy.props.BoolProperty(name="Camera Overlays", description="Only relevant in camera view", default=False)
-    section_show_overlays_cam: bpy.props.BoolProperty(name="", description="Show in camera view", default=True)
+    # (section_show_<key> / section_show_<key>_cam, see _SECTION_VISIBILITY_DEFAULTS)
+    __annotations__.update(_section_visibility_annotations())
     
     # Advanced Settings
     history_max_size: bpy.props.IntProperty(
@@ -106,7 +204,8 @@ class ViewportCameraControlsPreferences(bpy.types.AddonPreferences):
         default=0.3,
         min=0.1,
         max=2.0,
-        precision=2
+        precision=2,
+        update=update_settle_delay
     )
     
     start_gallery_on_load: bpy.props.BoolProperty(
@@ -220,6 +319,14 @@ class ViewportCameraControlsPreferences(bpy.types.AddonPreferences):
         max=256
     )
     
+    texture_cache_max: bpy.props.IntProperty(
+        name="Texture Cache Size",
+        description="Maximum number of gallery thumbnail textures kept in GPU memory (least recently used are freed first)",
+        default=256,
+        min=16,
+        max=4096
+    )
+    
     preview_backdrop_opacity: bpy.props.FloatProperty(
         name="Preview Backdrop",
         description="Opacity of dark backdrop when previewing thumbnail with MMB (0 = transparent, 1 = opaque)",
@@ -287,21 +394,10 @@ class ViewportCameraControlsPreferences(bpy.types.AddonPreferences):
         col = box.column(align=True)
         col.scale_y = 1.4
         
-        sub = col.split(factor=0.8, align=True)
-        sub.prop(self, "section_show_history", toggle=True)
-        sub.prop(self, "section_show_history_cam", toggle=True, icon='CAMERA_DATA')
-        
-        sub = col.split(factor=0.8, align=True)
-        sub.prop(self, "section_show_lens", toggle=True)
-        sub.prop(self, "section_show_lens_cam", toggle=True, icon='CAMERA_DATA')
-        
-        sub = col.split(factor=0.8, align=True)
-        sub.prop(self, "section_show_transform", toggle=True)
-        sub.prop(self, "section_show_transform_cam", toggle=True, icon='CAMERA_DATA')
-        
-        sub = col.split(factor=0.8, align=True)
-        sub.prop(self, "section_show_saved_views", toggle=True)
-        sub.prop(self, "section_show_saved_views_cam", toggle=True, icon='CAMERA_DATA')
+        for prop_name, cam_prop_name in _SECTION_TOGGLE_ROWS:
+            sub = col.split(factor=0.8, align=True)
+            sub.prop(self, prop_name, toggle=True)
+            sub.prop(self, cam_prop_name, toggle=True, icon='CAMERA_DATA')
         
         sub = col.split(factor=0.8, align=True)
         sub_disabled = sub.row(align=True)
@@ -321,21 +417,20 @@ class ViewportCameraControlsPreferences(bpy.types.AddonPreferences):
         if kc:
             km = kc.keymaps.get("3D View")
             if km:
-                shortcut_order = [
-                        ("view3d.viewport_controls", "Open Popup"),
-                        ("view3d.view_history_back", "History Back"),
-                        ("view3d.view_history_forward", "History Forward"),
-                        ("view3d.prev_saved_view", "Previous View"),
-                        ("view3d.next_saved_view", "Next View"),
-                    ]
-                for idname, label in shortcut_order:
-                    for kmi in km.keymap_items:
-                        if kmi.idname == idname:
-                            row = col.row(align=True)
-                            row.prop(kmi, "active", text="", emboss=False)
-                            row.label(text=label)
-                            row.prop(kmi, "type", text="", full_event=True)
-                            break
+                # One pass over the keymap (first match per operator), then
+                # draw in display order.
+                kmi_by_idname = {}
+                for kmi in km.keymap_items:
+                    idname = kmi.idname
+                    if idname in _SHORTCUT_IDNAMES and idname not in kmi_by_idname:
+                        kmi_by_idname[idname] = kmi
+                for idname, label in _SHORTCUT_ORDER:
+                    kmi = kmi_by_idname.get(idname)
+                    if kmi is not None:
+                        row = col.row(align=True)
+                        row.prop(kmi, "active", text="", emboss=False)
+                        row.label(text=label)
+                        row.prop(kmi, "type", text="", full_event=True)
         # ===== RIGHT COLUMN =====
         col_right = split.column()
         
@@ -350,25 +445,15 @@ class ViewportCameraControlsPreferences(bpy.types.AddonPreferences):
         row.label(text="History", icon='SCREEN_BACK')
         
         col = sub_box.column(align=True)
-        row = col.row(align=True)
-        split_row = row.split(factor=0.5)
-        split_row.label(text="Buffer Size:")
-        split_row.prop(self, "history_max_size", text="")
-            
-        row = col.row(align=True)
-        split_row = row.split(factor=0.5)
-        split_row.label(text="Settle Delay:")
-        split_row.prop(self, "settle_delay", text="")
+        _draw_labeled_prop(col, self, "Buffer Size:", "history_max_size")
+        _draw_labeled_prop(col, self, "Settle Delay:", "settle_delay")
         
         # --- Lens Subsection ---
         sub_box = box.box()
         row = sub_box.row()
         row.label(text="Lens", icon='CAMERA_DATA')
         
-        row = sub_box.row(align=True)
-        split_row = row.split(factor=0.5)
-        split_row.label(text="Lens Unit:")
-        split_row.prop(self, "default_lens_unit", expand=False)
+        _draw_labeled_prop(sub_box, self, "Lens Unit:", "default_lens_unit", text=None)
         
         # --- Views Subsection ---
         sub_box = box.box()
@@ -378,21 +463,9 @@ class ViewportCameraControlsPreferences(bpy.types.AddonPreferences):
         row = sub_box.row()
         row.prop(self, "start_gallery_on_load")
 
-        col = sub_box.column(align=True)            
-        row = col.row(align=True)
-        split_row = row.split(factor=0.5)
-        split_row.label(text="Thumbnail Size:")
-        split_row.prop(self, "thumbnail_size_max", text="")
-        
-        row = col.row(align=True)
-        split_row = row.split(factor=0.5)
-        split_row.label(text="MMB Big Preview Size:")
-        split_row.prop(self, "preview_size_factor", text="")
-        
-        row = col.row(align=True)
-        split_row = row.split(factor=0.5)
-        split_row.label(text="MMB Big Preview Backdrop:")
-        split_row.prop(self, "preview_backdrop_opacity", text="")
+        col = sub_box.column(align=True)
+        for label, prop_name in _GALLERY_SETTING_ROWS:
+            _draw_labeled_prop(col, self, label, prop_name)
         
         # --- View Styles Subsection ---
         sub_box = box.box()
@@ -400,10 +473,8 @@ class ViewportCameraControlsPreferences(bpy.types.AddonPreferences):
         row.label(text="View Styles-Remember", icon='PRESET')
         
         row = sub_box.row(align=True)
-        row.prop(self, "default_remember_perspective", toggle=True)
-        row.prop(self, "default_remember_shading", toggle=True)
-        row.prop(self, "default_remember_overlays", toggle=True)
-        row.prop(self, "default_remember_composition", toggle=True)
+        for prop_name in _REMEMBER_DEFAULT_PROPS:
+            row.prop(self, prop_name, toggle=True)
     
         # --- Camera Subsection ---
         sub_box = box.box()
@@ -445,10 +516,27 @@ class ViewportCameraControlsPreferences(bpy.types.AddonPreferences):
 # ============================================================================
 
 def get_preferences():
-    """Get addon preferences."""
+    """Get addon preferences.
+    
+    Looked up live on every call: reverting/reloading user preferences or
+    loading factory settings frees the struct while the addon stays
+    registered, so a cached RNA wrapper could dangle. Hot paths cache plain
+    values instead (e.g. utils.settle_delay_cache).
+    """
     return bpy.context.preferences.addons[__package__].preferences
 
 
+@persistent
+def _clear_preferences_cache(*_args):
+    """Drop cached preference-derived state (load_post handler)."""
+    global _tagged_collections_cache, _tagged_collections_key
+    _tagged_collections_cache = []
+    _tagged_collections_key = None
+    # A newly loaded file may hold collections built from older values
+    _last_applied_collection["name"] = None
+    _last_applied_collection["color"] = None
+
+
 # ============================================================================
 # REGISTRATION
 # ============================================================================
@@ -461,8 +549,13 @@ classes = [
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    if _clear_preferences_cache not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_clear_preferences_cache)
 
 
 def unregister():
+    if _clear_preferences_cache in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_clear_preferences_cache)
+    _clear_preferences_cache()
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
@@ -1,23 +1,28 @@
 """Preview manager for ViewPilot panel icon gallery."""
 
 import os
+from array import array
 
 import bpy
 import bpy.utils.previews
 
+from . import data_storage
 from . import utils
 from .temp_paths import make_temp_png_path, sanitize_token
 
 # Global storage for preview collections and per-view active preview ids.
 preview_collections = {}
 _active_preview_ids = {}
+_preview_ids_version = 0  # bumped whenever _active_preview_ids changes
 _preview_serial = 0
 _last_saved_views_signature = ()
 _undo_refresh_queued = False
 _icon_retry_queued = False
+_pending_preview_loads = set()  # view names queued for a lazy preview load
 _is_registered = False
 _panel_items_cache = []
-_panel_items_signature = None
+_panel_items_signature = None  # (data_storage views version, _preview_ids_version)
+_panel_item_tuples = {}  # (index, view name, icon id) -> enum item, reused across rebuilds
 
 def _remove_handler_variants(handler_list, handler, include_current=False):
     """Remove stale handler variants by function identity/name/module.
@@ -70,22 +75,8 @@ def _next_preview_id(view_name):
     _preview_serial += 1
     return f"vp_{sanitize_token(view_name)}_{_preview_serial}"
 
-def _compute_panel_items_signature(saved_views):
-    """Build a signature for panel icon enum item caching."""
-    view_sig = tuple(
-        (
-            view.get("name", ""),
-            view.get("thumbnail_image", ""),
-        )
-        for view in saved_views
-    )
-    preview_sig = tuple(sorted(_active_preview_ids.items()))
-    return (view_sig, preview_sig)
-
 def _compute_saved_views_signature():
     """Build a cheap signature so undo/redo refresh only runs when needed."""
-    from . import data_storage
-
     try:
         views = data_storage.get_saved_views()
     except (RuntimeError, ReferenceError, AttributeError, ValueError):
@@ -102,9 +93,13 @@ def _compute_saved_views_signature():
     return tuple(signature)
 
 def _preview_cache_out_of_sync(signature):
-    """Return True when preview mappings don't match current saved views."""
-    expected_names = [entry[0] for entry in signature]
-    if len(_active_preview_ids) != len(expected_names):
+    """Return True when preview mappings don't match current saved views.
+    
+    Previews load lazily, so views without a mapping yet are fine; only
+    mappings for vanished views or dropped preview entries count.
+    """
+    expected_names = {entry[0] for entry in signature}
+    if len(_active_preview_ids) > len(expected_names):
         return True
 
     try:
@@ -112,9 +107,8 @@ def _preview_cache_out_of_sync(signature):
     except (RuntimeError, ReferenceError, AttributeError, ValueError) as error:
         return True
 
-    for view_name in expected_names:
-        preview_id = _active_preview_ids.get(view_name)
-        if not preview_id:
+    for view_name, preview_id in _active_preview_ids.items():
+        if view_name not in expected_names:
             return True
         if preview_id not in pcoll:
             return True
@@ -171,7 +165,7 @@ def _queue_undo_refresh():
         try:
             context = bpy.context
             if context and hasattr(context, 'scene') and context.scene:
-                reload_all_previews(context)
+                clear_all_previews()
                 _request_gallery_refresh()
         except (RuntimeError, ReferenceError, AttributeError, ValueError) as e:
             pass
@@ -181,6 +175,25 @@ def _queue_undo_refresh():
 
     bpy.app.timers.register(_delayed_refresh, first_interval=0.05)
 
+def _flush_preview_loads():
+    """Timer callback: load one queued preview per tick until the queue is empty."""
+    while _pending_preview_loads:
+        view_name = _pending_preview_loads.pop()
+        try:
+            if refresh_view_preview(view_name):
+                break
+        except (RuntimeError, ReferenceError, AttributeError, ValueError, OSError):
+            continue
+    return 0.0 if _pending_preview_loads else None
+
+def _queue_preview_load(view_name):
+    """Load a view's preview on a later timer tick instead of during UI draw."""
+    if view_name in _pending_preview_loads:
+        return
+    _pending_preview_loads.add(view_name)
+    if not bpy.app.timers.is_registered(_flush_preview_loads):
+        bpy.app.timers.register(_flush_preview_loads, first_interval=0.0)
+
 def _write_preview_temp_file(image, view_name):
     """Export a packed blender image to temp file for preview loading."""
     temp_path = make_temp_png_path("vp_preview_", view_name)
@@ -220,13 +233,8 @@ def get_preview_collection():
         preview_collections["viewpilot_previews"] = bpy.utils.previews.new()
     return preview_collections["viewpilot_previews"]
 
-def load_view_preview(view_name, thumbnail_path, replace_existing=True):
-    """Load or replace a thumbnail image in the preview collection."""
-    if not thumbnail_path or not os.path.exists(thumbnail_path):
-        return 0
-
-    pcoll = get_preview_collection()
-
+def _claim_preview_id(pcoll, view_name, replace_existing):
+    """Drop a view's previous preview entry if replacing, and pick the id to load into."""
     if replace_existing:
         old_id = _active_preview_ids.get(view_name)
         if old_id and old_id in pcoll:
@@ -239,12 +247,55 @@ def load_view_preview(view_name, thumbnail_path, replace_existing=True):
     # Use a fresh id on replacement, because individual entry removal from
     # preview collections is not reliable across Blender versions.
     if replace_existing or view_name not in _active_preview_ids:
-        preview_id = _next_preview_id(view_name)
-    else:
-        preview_id = _active_preview_ids[view_name]
+        return _next_preview_id(view_name)
+    return _active_preview_ids[view_name]
+
+def load_view_preview_from_image(view_name, image):
+    """Copy a thumbnail image's pixels straight into a new preview entry.
+    
+    Skips the PNG export/reload round trip. Thumbnails are stored as
+    Non-Color display-ready pixels, so the raw float buffer is what the
+    exported PNG would contain. Returns 0 if the copy fails so callers can
+    fall back to the file-based path.
+    """
+    try:
+        width, height = image.size
+        channels = image.channels
+    except (RuntimeError, ReferenceError, AttributeError, TypeError, ValueError):
+        return 0
+    # Preview buffers are RGBA.
+    if not width or not height or channels != 4:
+        return 0
+
+    pcoll = get_preview_collection()
+    preview_id = _claim_preview_id(pcoll, view_name, replace_existing=True)
+
+    try:
+        pixels = array('f', bytes(4 * width * height * 4))
+        image.pixels.foreach_get(pixels)
+        preview = pcoll.new(preview_id)
+        preview.image_size = (width, height)
+        preview.image_pixels_float.foreach_set(pixels)
+        preview.icon_size = (width, height)
+        preview.icon_pixels_float.foreach_set(pixels)
+    except (RuntimeError, ReferenceError, AttributeError, TypeError, ValueError, KeyError):
+        return 0
+
+    _mark_preview_ids_changed()
+    _active_preview_ids[view_name] = preview_id
+    return preview.icon_id
+
+def load_view_preview(view_name, thumbnail_path, replace_existing=True):
+    """Load or replace a thumbnail image in the preview collection."""
+    if not thumbnail_path or not os.path.exists(thumbnail_path):
+        return 0
+
+    pcoll = get_preview_collection()
+    preview_id = _claim_preview_id(pcoll, view_name, replace_existing)
 
     try:
         pcoll.load(preview_id, thumbnail_path, 'IMAGE')
+        _mark_preview_ids_changed()
         _active_preview_ids[view_name] = preview_id
         icon_id = pcoll[preview_id].icon_id
         if not icon_id:
@@ -262,18 +313,23 @@ def get_preview_icon_id(view_name):
     return 0
 
 def get_view_icon_id_fast(view_name, thumbnail_image=""):
-    """Fast icon lookup for UI lists without triggering preview refresh work."""
-    return get_preview_icon_id(view_name)
-def remove_view_preview(view_name):
+    """Fast icon lookup for UI lists without triggering preview refresh work.
+    
+    A missing preview for an existing thumbnail is queued for a lazy load.
+    """
+    icon_id = get_preview_icon_id(view_name)
+    if not icon_id and thumbnail_image and bpy.data.images.get(thumbnail_image):
+        _queue_preview_load(view_name)
+    return icon_id
+def remove_view_preview(view_name, invalidate_cache=True):
     """Forget active preview mapping for a deleted/renamed view."""
-    if view_name in _active_preview_ids:
-        del _active_preview_ids[view_name]
-    invalidate_panel_gallery_cache()
+    if _active_preview_ids.pop(view_name, None) is not None:
+        _mark_preview_ids_changed()
+    if invalidate_cache:
+        invalidate_panel_gallery_cache()
 
 def _resolve_thumbnail_image_name(view_name):
     """Resolve thumbnail image datablock name for a saved view."""
-    from . import data_storage
-
     direct_name = f".VP_Thumb_{view_name}"
     if bpy.data.images.get(direct_name):
         return direct_name
@@ -298,11 +354,13 @@ def refresh_view_preview(view_name):
     if not img:
         return 0
 
-    temp_path = _write_preview_temp_file(img, view_name)
-    if not temp_path:
-        return 0
-
-    icon_id = load_view_preview(view_name, temp_path, replace_existing=True)
+    icon_id = load_view_preview_from_image(view_name, img)
+    if not icon_id:
+        # File-based fallback when the pixel copy isn't possible.
+        temp_path = _write_preview_temp_file(img, view_name)
+        if not temp_path:
+            return 0
+        icon_id = load_view_preview(view_name, temp_path, replace_existing=True)
     # Always invalidate cache after a load attempt so enum rebuild can
     # pick up asynchronous icon_id updates.
     invalidate_panel_gallery_cache()
@@ -311,32 +369,41 @@ def refresh_view_preview(view_name):
         _queue_panel_icon_retry()
     return icon_id
 
-def reload_all_previews(context):
-    """Reload all view previews from packed blender images."""
-    from . import data_storage
+def clear_all_previews():
+    """Drop every loaded preview; views reload theirs lazily when next drawn."""
     global _preview_serial
 
     pcoll = get_preview_collection()
     pcoll.clear()
     _active_preview_ids.clear()
+    _pending_preview_loads.clear()
+    _mark_preview_ids_changed()
     _preview_serial = 0
+    invalidate_panel_gallery_cache()
+
+def reload_all_previews(context):
+    """Reload all view previews from packed blender images.
+    
+    The PNG exports run through the lazy loader, one view per timer tick,
+    so a large library doesn't block the UI for the whole batch.
+    Returns the number of previews queued.
+    """
+    clear_all_previews()
 
-    loaded = 0
+    queued = 0
     for view_dict in data_storage.get_saved_views():
         view_name = view_dict.get("name", "View")
         image_name = view_dict.get("thumbnail_image", "") or f".VP_Thumb_{view_name}"
-        img = bpy.data.images.get(image_name)
-        if not img:
-            continue
-
-        temp_path = _write_preview_temp_file(img, view_name)
-        if not temp_path:
+        if not bpy.data.images.get(image_name):
             continue
+        _queue_preview_load(view_name)
+        queued += 1
+    return queued
 
-        if load_view_preview(view_name, temp_path, replace_existing=True):
-            loaded += 1
-
-    invalidate_panel_gallery_cache()
+def _mark_preview_ids_changed():
+    """Bump the preview id version so the panel enum items get rebuilt."""
+    global _preview_ids_version
+    _preview_ids_version += 1
 
 def invalidate_panel_gallery_cache():
     """Invalidate panel icon view state."""
@@ -347,48 +414,45 @@ def invalidate_panel_gallery_cache():
 
 def get_panel_gallery_items(self, context):
     """Generate enum items for panel gallery template_icon_view."""
-    from . import data_storage
+    global _panel_items_cache, _panel_items_signature, _panel_item_tuples
 
-    global _panel_items_cache, _panel_items_signature
-
-    saved_views = data_storage.get_saved_views()
-    signature = _compute_panel_items_signature(saved_views)
+    # Counters instead of a per-view signature keep the redraw hit path O(1)
+    signature = (data_storage.get_views_version(), _preview_ids_version)
 
     if _panel_items_signature == signature and _panel_items_cache:
         return _panel_items_cache
 
+    saved_views = data_storage.get_saved_views()
+
     items = []
-    has_pending_icons = False
+    item_tuples = {}
 
     for i, view_dict in enumerate(saved_views):
         view_name = view_dict.get("name", f"View {i+1}")
-        thumb_name = view_dict.get("thumbnail_image", "")
-        resolved_thumb = thumb_name or _resolve_thumbnail_image_name(view_name)
-        has_thumb = bool(resolved_thumb and bpy.data.images.get(resolved_thumb))
 
+        # Missing previews load on a timer (one per tick), never inside this
+        # enum callback; the preview id version bump then rebuilds the items.
         icon_id = get_preview_icon_id(view_name)
-        if has_thumb and not icon_id:
-            icon_id = refresh_view_preview(view_name)
-            if not icon_id:
-                has_pending_icons = True
-
-        identifier = str(i)
-        name = str(view_name)
-        description = f"Navigate to {view_name}"
-        items.append((identifier, name, description, icon_id, i))
+        if not icon_id:
+            thumb_name = view_dict.get("thumbnail_image", "")
+            resolved_thumb = thumb_name or _resolve_thumbnail_image_name(view_name)
+            if resolved_thumb and bpy.data.images.get(resolved_thumb):
+                _queue_preview_load(view_name)
+
+        # Unchanged rows reuse their tuple; only new/renamed/re-iconed rows are formatted
+        key = (i, view_name, icon_id)
+        item = _panel_item_tuples.get(key)
+        if item is None:
+            item = (str(i), str(view_name), f"Navigate to {view_name}", icon_id, i)
+        item_tuples[key] = item
+        items.append(item)
+    _panel_item_tuples = item_tuples
 
     if not items:
         items.append(('NONE', "No Views", "No saved views", 0, 0))
 
-    if not has_pending_icons:
-        _panel_items_cache = items
-        _panel_items_signature = signature
-    else:
-        _panel_items_cache = []
-        _panel_items_signature = None
-
-    if has_pending_icons:
-        _queue_panel_icon_retry()
+    _panel_items_cache = items
+    _panel_items_signature = signature
     return items
 class VIEWPILOT_OT_reload_previews(bpy.types.Operator):
     """Reload thumbnail previews for panel gallery"""
@@ -397,20 +461,19 @@ class VIEWPILOT_OT_reload_previews(bpy.types.Operator):
     bl_options = {'REGISTER'}
     
     def execute(self, context):
-        from . import data_storage
-        reload_all_previews(context)
-        self.report({'INFO'}, f"Reloaded {len(data_storage.get_saved_views())} previews")
+        queued = reload_all_previews(context)
+        self.report({'INFO'}, f"Reloading {queued} previews")
         return {'FINISHED'}
 
 @bpy.app.handlers.persistent
 def on_file_load(dummy):
-    """Reload previews when a file is opened."""
+    """Reset previews when a file is opened; they reload lazily when drawn."""
     # Use timer to delay - context may not be fully ready immediately
     def delayed_reload():
         try:
             context = bpy.context
             if context and hasattr(context, 'scene') and context.scene:
-                reload_all_previews(context)
+                clear_all_previews()
                 _request_gallery_refresh()
         except (RuntimeError, ReferenceError, AttributeError, ValueError) as error:
             pass
@@ -477,7 +540,7 @@ def register():
 
 def unregister():
     """Clean up preview collection."""
-    global preview_collections, _preview_serial, _last_saved_views_signature, _undo_refresh_queued, _icon_retry_queued, _is_registered, _panel_items_cache, _panel_items_signature
+    global preview_collections, _preview_serial, _last_saved_views_signature, _undo_refresh_queued, _icon_retry_queued, _is_registered, _panel_items_cache, _panel_items_signature, _panel_item_tuples
     
     # Remove handlers (current + stale variants from prior reloads).
     _remove_handler_variants(bpy.app.handlers.load_post, on_file_load, include_current=True)
@@ -498,8 +561,12 @@ def unregister():
     _last_saved_views_signature = ()
     _undo_refresh_queued = False
     _icon_retry_queued = False
+    if bpy.app.timers.is_registered(_flush_preview_loads):
+        bpy.app.timers.unregister(_flush_preview_loads)
+    _pending_preview_loads.clear()
     _panel_items_cache = []
     _panel_items_signature = None
+    _panel_item_tuples = {}
     _is_registered = False
 
 
@@ -7,11 +7,14 @@ import bpy
 import math
 import time
 from mathutils import Vector, Euler, Quaternion
+from . import data_storage
+from . import utils
 from .state_controller import get_controller, UpdateSource, LockPriority
 from .utils import (
     get_view_location, set_view_location, add_to_history,
     get_selection_center, get_orbit_focus_selection, get_orbit_focus_view_layer_objects, find_view3d_context,
-    find_view3d_override_context, find_window_for_area
+    find_view3d_override_context, find_window_for_area, refresh_monitor_active_flags,
+    is_camera_enum_item
 )
 
 # ============================================================================
@@ -161,6 +164,10 @@ def update_screen_rotation(self, context):
     finally:
         controller.end_update()
 
+def update_keep_camera_active(self, context):
+    """Keep the history monitor's fast-path mask in sync."""
+    refresh_monitor_active_flags(self)
+
 def update_orbit_mode_toggle(self, context):
     """Initialize turntable orbit mode when toggled on.
     
@@ -168,6 +175,7 @@ def update_orbit_mode_toggle(self, context):
     then sets all orbit values to zero as the reference point.
     In camera mode, skips framing and uses camera's current position.
     """
+    refresh_monitor_active_flags(self)
     if not self.init_complete: return
     
     controller = get_controller()
@@ -951,8 +959,6 @@ def get_saved_views_items(self, context):
     Note: Items must be cached to prevent Python garbage collection,
     which causes garbled Unicode text in Blender's EnumProperty.
     """
-    from . import data_storage
-
     # Guard against nested RNA callback re-entry.
     if getattr(get_saved_views_items, "_building", False):
         cached = getattr(get_saved_views_items, "_cached_items", [])
@@ -962,7 +968,7 @@ def get_saved_views_items(self, context):
 
     get_saved_views_items._building = True
     items = []
-    saved_views = []
+    view_names = None
     stale_idx = -1
     
     # Determine the name for the 'Not Saved' / Ghost option
@@ -974,52 +980,67 @@ def get_saved_views_items(self, context):
         stale_idx = current_idx
         last_idx = props.last_active_view_index
         
-        # Get views from JSON storage
-        saved_views = data_storage.get_saved_views()
+        # Get view names from JSON storage
+        view_names = data_storage.get_saved_view_names()
         
         # If we are effectively "unsaved" (index -1) but have a ghost tracking history
         if current_idx == -1 and last_idx != -1:
             try:
                 # Get name of the last active view
-                if 0 <= last_idx < len(saved_views):
-                    last_view_name = saved_views[last_idx].get("name", "View")
+                if 0 <= last_idx < len(view_names):
+                    last_view_name = view_names[last_idx]
                     # Safely format with asterisks (Unicode-safe)
                     none_label = f"*{last_view_name}*"
             except (TypeError, ValueError, IndexError, AttributeError, RuntimeError):
                 pass
 
     try:
+        if view_names is None:
+            view_names = data_storage.get_saved_view_names()
+        
+        # Reuse the previous list object while its inputs are unchanged. Blender
+        # calls this on every dropdown draw/hover, and returning the same list
+        # also keeps the item strings alive.
+        stale_extra = stale_idx if stale_idx >= len(view_names) else -1
+        cached_key = get_saved_views_items._cached_key
+        cached = get_saved_views_items._cached_items
+        if (
+            cached
+            and cached_key is not None
+            and cached_key[0] is view_names
+            and cached_key[1:] == (none_label, stale_extra)
+        ):
+            return cached
+        
         # Always include the blank/None option to ensure list indices don't shift
         items.append(('NONE', none_label, "No saved view selected"))
         
-        if not saved_views:
-            saved_views = data_storage.get_saved_views()
-        for i, view in enumerate(saved_views):
+        for i, view_name in enumerate(view_names):
             # Use index as identifier (ASCII-safe), name for display
-            items.append((str(i), view.get("name", f"View {i+1}"), f"View {i+1}"))
+            items.append((str(i), view_name, f"View {i+1}"))
 
         # Transitional compatibility: if Blender is still holding a stale
         # enum value while scenes/files are syncing, include it once so RNA
         # doesn't spam warnings before our clamping logic runs.
-        if stale_idx >= 0:
-            stale_id = str(stale_idx)
-            valid_ids = {item[0] for item in items}
-            if stale_id not in valid_ids:
-                items.append((stale_id, "(syncing)", "Temporary stale selection"))
+        if stale_extra >= 0:
+            items.append((str(stale_extra), "(syncing)", "Temporary stale selection"))
         
         # CRITICAL: Cache items to prevent garbage collection of Unicode strings
         get_saved_views_items._cached_items = items
+        get_saved_views_items._cached_key = (view_names, none_label, stale_extra)
         return items
     finally:
         get_saved_views_items._building = False
 
 # Initialize cache
 get_saved_views_items._cached_items = []
+get_saved_views_items._cached_key = None  # (names list, none label, stale index)
 get_saved_views_items._building = False
 
 def invalidate_saved_views_enum_cache():
     """Invalidate cached items for saved views EnumProperty."""
     get_saved_views_items._cached_items = []
+    get_saved_views_items._cached_key = None
 
 def invalidate_saved_views_ui_caches():
     """Invalidate caches related to saved views UI (dropdown + panel icon view)."""
@@ -1101,8 +1122,6 @@ def _sync_saved_view_selection_enums(self, controller, enum_value: str):
 
 def _handle_saved_view_selection(self, context, enum_value: str):
     """Shared handler for selecting/loading a saved view from any UI source."""
-    from . import data_storage
-
     controller = get_controller()
 
     # Always sync both enums for UI consistency (even during skip_enum_load)
@@ -1240,7 +1259,6 @@ def update_saved_views_enum(self, context):
 def _sync_view_to_json(view_item, context, prop_name):
     """Callback to sync a SavedViewItem property change to JSON storage."""
     # Skip during sync_to_all_scenes to prevent O(N*M) IO explosion
-    from . import data_storage
     if data_storage.IS_SYNCING:
         return
     
@@ -1260,16 +1278,15 @@ def _sync_view_to_json(view_item, context, prop_name):
             return
         
         # Update the JSON storage
-        from . import data_storage
-        views = data_storage.get_saved_views()
+        # load_data() parses a fresh copy, so the shared get_saved_views()
+        # cache is only replaced once the write succeeds.
+        data = data_storage.load_data()
+        views = data["saved_views"]
         if 0 <= idx < len(views):
             # Get the current value from the PropertyGroup
-            new_value = getattr(view_item, prop_name)
-            views[idx][prop_name] = new_value
+            views[idx][prop_name] = getattr(view_item, prop_name)
             
             # Save back to JSON
-            data = data_storage.load_data()
-            data["saved_views"] = views
             data_storage.save_data(data)
     except (RuntimeError, ReferenceError, AttributeError, TypeError, ValueError) as e:
         pass
@@ -1500,7 +1517,7 @@ class ViewPilotProperties(bpy.types.PropertyGroup):
     # Camera mode properties
     is_camera_mode: bpy.props.BoolProperty(default=False, options={'SKIP_SAVE'})
     tracked_camera_name: bpy.props.StringProperty(default="", options={'SKIP_SAVE'})
-    keep_camera_active: bpy.props.BoolProperty(name="Keep Camera Active", default=False, options={'SKIP_SAVE'})
+    keep_camera_active: bpy.props.BoolProperty(name="Keep Camera Active", default=False, options={'SKIP_SAVE'}, update=update_keep_camera_active)
     
     # Track which saved view was active before modification (Ghost View tracking)
     last_active_view_index: bpy.props.IntProperty(default=-1, options={'SKIP_SAVE'})
@@ -1708,6 +1725,9 @@ class ViewPilotProperties(bpy.types.PropertyGroup):
         if getattr(self, '_is_reinitializing', False):
             return
         self._is_reinitializing = True
+        # Any reinit (monitor sync, camera switches, ...) may move the panel
+        # off load_saved_view's recorded state, so its skip must not match.
+        utils.reinit_signature = None
         
         try:
             # 1. Resolve Space and Region robustly.
@@ -1726,14 +1746,16 @@ class ViewPilotProperties(bpy.types.PropertyGroup):
             self.tracked_camera_name = active_cam.name if active_cam else ""
             
             # Sync camera dropdown to show current camera
-            # Note: Dynamic enums require try/except as the item might not exist yet
-            try:
-                if active_cam:
+            # Note: Dynamic enum items are checked up front; 'NONE' is only
+            # listed when the scene has no cameras, so it still needs try/except
+            if active_cam:
+                if is_camera_enum_item(context.scene, active_cam):
                     self.camera_enum = active_cam.name
-                else:
+            else:
+                try:
                     self.camera_enum = 'NONE'
-            except TypeError:
-                pass  # Enum items not yet populated
+                except TypeError:
+                    pass  # Enum items not yet populated
             
             # Sync panel gallery enum to current saved view index
             try:
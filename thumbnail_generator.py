@@ -26,6 +26,24 @@ def _temp_thumbnail_path(image_name):
     """Get a deterministic temp path for OpenGL thumbnail output."""
     return make_temp_png_path("_vp_thumb_", image_name)
 
+class ViewDataProxy:
+    """
+    Read-only attribute view over a saved-view dict.
+    Lets the renderer read stored views like PropertyGroups without
+    copying every key into a new namespace.
+    """
+    
+    __slots__ = ("_data",)
+    
+    def __init__(self, data):
+        self._data = data
+    
+    def __getattr__(self, name):
+        try:
+            return self._data[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
 class ThumbnailRenderer:
     """
     Renders thumbnails using bpy.ops.render.opengl.
@@ -734,7 +752,9 @@ def get_renderer(size=256):
     return _renderer
 
 def generate_thumbnail(context, saved_view, name_suffix=None, refresh_preview=True):
-    """Generate a thumbnail for a saved view."""
+    """Generate a thumbnail for a saved view (PropertyGroup-like or dict)."""
+    if isinstance(saved_view, dict):
+        saved_view = ViewDataProxy(saved_view)
     if name_suffix is None:
         name_suffix = saved_view.name
     
@@ -752,16 +772,20 @@ def generate_thumbnail(context, saved_view, name_suffix=None, refresh_preview=Tr
     
     return result
 
-def delete_thumbnail(view_name):
-    """Delete the thumbnail image for a saved view."""
-    image_name = f".VP_Thumb_{view_name}"
-    img = bpy.data.images.get(image_name)
+def delete_thumbnail(view_name, invalidate_cache=True):
+    """Delete the thumbnail image for a saved view.
+    
+    Pass invalidate_cache=False when the caller refreshes the saved-view UI
+    caches itself right afterwards.
+    """
+    images = bpy.data.images
+    img = images.get(f".VP_Thumb_{view_name}")
     if img:
-        bpy.data.images.remove(img)
+        images.remove(img)
     
     # Remove preview mapping and invalidate panel gallery cache.
     try:
         from .preview_manager import remove_view_preview
-        remove_view_preview(view_name)
+        remove_view_preview(view_name, invalidate_cache)
     except (ImportError, AttributeError, TypeError, ValueError, RuntimeError):
         pass
@@ -12,6 +12,42 @@ from .modal_gallery import VIEW3D_OT_thumbnail_gallery
 # SHARED DRAW FUNCTIONS
 # =============================================================================
 
+def _get_section_visibility(in_camera_mode):
+    """Return (lens, transform, history, saved_views, viewport_display) flags.
+    
+    Read from preferences once per mode and cached until one of the section
+    toggles changes (its update callback clears utils.section_visibility_cache).
+    """
+    cached = utils.section_visibility_cache.get(in_camera_mode)
+    if cached is not None:
+        return cached
+    
+    from . import preferences
+    try:
+        prefs = preferences.get_preferences()
+        if in_camera_mode:
+            flags = (
+                prefs.section_show_lens_cam,
+                prefs.section_show_transform_cam,
+                prefs.section_show_history_cam,
+                prefs.section_show_saved_views_cam,
+                prefs.section_show_overlays_cam,
+            )
+        else:
+            flags = (
+                prefs.section_show_lens,
+                prefs.section_show_transform,
+                prefs.section_show_history,
+                prefs.section_show_saved_views,
+                False,
+            )
+    except (ImportError, AttributeError, TypeError, ValueError, RuntimeError):
+        # Fallback values are not cached so preferences are retried next draw
+        return (True, True, True, True, in_camera_mode)
+    
+    utils.section_visibility_cache[in_camera_mode] = flags
+    return flags
+
 def draw_viewpilot_controls(layout, context, location='popup'):
     """Draw the full set of ViewPilot controls.
     
@@ -26,20 +62,9 @@ def draw_viewpilot_controls(layout, context, location='popup'):
     in_camera_mode = props.is_camera_mode
     
     # Get visibility preferences (shared across all panel locations)
-    from . import preferences
-    try:
-        prefs = preferences.get_preferences()
-        show_lens = prefs.section_show_lens if not in_camera_mode else prefs.section_show_lens_cam
-        show_transform = prefs.section_show_transform if not in_camera_mode else prefs.section_show_transform_cam
-        show_history = prefs.section_show_history if not in_camera_mode else prefs.section_show_history_cam
-        show_saved_views = prefs.section_show_saved_views if not in_camera_mode else prefs.section_show_saved_views_cam
-        show_viewport_display = prefs.section_show_overlays_cam if in_camera_mode else False
-    except (ImportError, AttributeError, TypeError, ValueError, RuntimeError):
-        show_lens = True
-        show_transform = True
-        show_history = True
-        show_saved_views = True
-        show_viewport_display = in_camera_mode
+    show_lens, show_transform, show_history, show_saved_views, show_viewport_display = (
+        _get_section_visibility(in_camera_mode)
+    )
 
     # History
     if show_history:
@@ -4,6 +4,7 @@ Utility functions and global state for ViewPilot
 
 import bpy
 import time
+from collections import deque
 from mathutils import Vector, Quaternion
 from bpy.app.handlers import persistent
 
@@ -13,15 +14,49 @@ from bpy.app.handlers import persistent
 # ============================================================================
 
 VIEW_HISTORY_MAX = 20
-view_history = []             # List of state dictionaries
+view_history = deque(maxlen=VIEW_HISTORY_MAX)  # Ring buffer of state dictionaries
 view_history_index = -1       # Current position in history (-1 means "Live/Newest")
 active_popup_operator = None  # Reference to active popup for UI updates
 monitor_running = False       # Prevents multiple monitor instances
+selection_dirty = True        # Set on depsgraph updates; monitor rebuilds selection hash only when set
+camera_count_dirty = True     # Set when cameras may have been added/removed; monitor recounts only when set
+ids_dirty = True              # Set when scenes/objects changed; monitor maintenance is skipped otherwise
+settle_delay_cache = None     # Cached settle_delay preference, cleared by its update callback
+section_visibility_cache = {} # in_camera_mode -> panel section flags, cleared by the toggles' update callback
+geometry_version = 0          # Bumped when raycastable geometry may have changed (dolly BVH cache key)
+collection_version = 0        # Bumped on scene/collection updates (tagged camera collection cache key)
+reinit_signature = None       # Viewport signature of load_saved_view's last panel reinit; any other reinit clears it
+render_version = 0            # Bumped when anything a thumbnail shows may have changed (thumbnail staleness key)
+
+# Non-object datablocks whose edits change what a viewport capture shows
+RENDER_CONTENT_TYPES = (bpy.types.Material, bpy.types.Light, bpy.types.World, bpy.types.NodeTree)
+
+# Object types that contribute surfaces to scene raycasts
+GEOMETRY_OBJECT_TYPES = {'MESH', 'CURVE', 'SURFACE', 'FONT', 'META'}
+
+# Modes that need per-tick monitoring, folded into one mask for the monitor's fast path
+MONITOR_FLAG_ORBIT = 1
+MONITOR_FLAG_KEEP_CAMERA = 2
+monitor_active_flags = 0
 
 # NOTE: Lock state is now managed by StateController - see state_controller.py
 # Removed: restoration_lock_until, skip_enum_load, property_update_lock_until
 
 
+def refresh_monitor_active_flags(props):
+    """Recompute the monitor fast-path mask from a ViewPilot property group."""
+    global monitor_active_flags
+    flags = 0
+    try:
+        if props.orbit_around_selection:
+            flags |= MONITOR_FLAG_ORBIT
+        if props.keep_camera_active:
+            flags |= MONITOR_FLAG_KEEP_CAMERA
+    except (RuntimeError, ReferenceError, AttributeError):
+        pass
+    monitor_active_flags = flags
+
+
 # ============================================================================
 # VIEW_3D CONTEXT UTILITIES
 # ============================================================================
@@ -160,6 +195,34 @@ def _resolve_preferred_view3d_area(context, preferred_area):
     return None
 
 
+_view3d_area_hint = (0, -1, 0)  # (screen pointer, area index, area pointer) of last screen-scan hit
+
+
+def _remember_view3d_area(screen, index, area):
+    """Record where the last screen scan found a usable VIEW_3D area."""
+    global _view3d_area_hint
+    _view3d_area_hint = (screen.as_pointer(), index, area.as_pointer())
+
+
+def _hinted_view3d_area(screen):
+    """
+    Return the remembered VIEW_3D area of this screen if it is still there.
+    
+    Only pointers are stored; the area is re-fetched by index and its pointer
+    compared, so a closed or rearranged area simply misses.
+    """
+    screen_ptr, index, area_ptr = _view3d_area_hint
+    if index < 0 or screen.as_pointer() != screen_ptr:
+        return None
+    areas = screen.areas
+    if index >= len(areas):
+        return None
+    area = areas[index]
+    if area.as_pointer() != area_ptr or area.type != 'VIEW_3D':
+        return None
+    return area
+
+
 def find_view3d_context(context, preferred_area=None):
     """
     Find VIEW_3D area, space, and region from any context.
@@ -184,12 +247,20 @@ def find_view3d_context(context, preferred_area=None):
         if region:
             return (area, context.space_data, region)
     
-    # Fall back to searching screen
-    if context.screen:
-        for area in context.screen.areas:
+    # Fall back to searching screen, starting with the area found last time
+    # (poll and execute usually resolve the same area back to back).
+    screen = context.screen
+    if screen:
+        area = _hinted_view3d_area(screen)
+        if area:
+            space, region = _get_view3d_space_region(area)
+            if space and region:
+                return (area, space, region)
+        for index, area in enumerate(screen.areas):
             if area.type == 'VIEW_3D':
                 space, region = _get_view3d_space_region(area)
                 if space and region:
+                    _remember_view3d_area(screen, index, area)
                     return (area, space, region)
 
     # Last resort: scan all windows/screens.
@@ -208,6 +279,40 @@ def find_view3d_context(context, preferred_area=None):
     return (None, None, None)
 
 
+VIEW3D_POLL_CACHE_TTL = 0.1  # Seconds a has_view3d_context() answer is reused
+_view3d_poll_cache = (None, False, 0.0)  # (screen/area key, result, expiry)
+
+
+def has_view3d_context(context):
+    """
+    Cached boolean form of find_view3d_context() for poll() methods.
+    
+    Only the answer is cached (never area/space/region wrappers, which can
+    dangle once an area is closed), keyed on screen and area and reused for
+    VIEW3D_POLL_CACHE_TTL seconds, since polls run on every UI redraw.
+    """
+    global _view3d_poll_cache
+    # Direct context needs no lookup at all
+    if context.region_data and context.space_data and context.space_data.type == 'VIEW_3D':
+        return True
+    
+    screen = context.screen
+    area = context.area
+    key = (
+        screen.as_pointer() if screen else 0,
+        area.as_pointer() if area else 0,
+    )
+    now = time.monotonic()
+    cached_key, result, expires = _view3d_poll_cache
+    if key == cached_key and now < expires:
+        return result
+    
+    _, space, region = find_view3d_context(context)
+    result = bool(space and region)
+    _view3d_poll_cache = (key, result, now + VIEW3D_POLL_CACHE_TTL)
+    return result
+
+
 def find_view3d_override_context(context, preferred_area=None):
     """
     Find VIEW_3D area/space/WINDOW-region tuple for temp overrides.
@@ -331,19 +436,15 @@ def get_selection_center(context):
     if not selected:
         return None
     
-    # Calculate combined world-space bounding box
-    min_co = Vector((float('inf'), float('inf'), float('inf')))
-    max_co = Vector((float('-inf'), float('-inf'), float('-inf')))
-    
+    # Gather all world-space corners, then reduce each axis once
+    corners = []
     for obj in selected:
-        for corner in obj.bound_box:
-            world_co = obj.matrix_world @ Vector(corner)
-            min_co.x = min(min_co.x, world_co.x)
-            min_co.y = min(min_co.y, world_co.y)
-            min_co.z = min(min_co.z, world_co.z)
-            max_co.x = max(max_co.x, world_co.x)
-            max_co.y = max(max_co.y, world_co.y)
-            max_co.z = max(max_co.z, world_co.z)
+        matrix = obj.matrix_world
+        corners.extend(matrix @ Vector(corner) for corner in obj.bound_box)
+    
+    # Calculate combined world-space bounding box
+    min_co = Vector((min(c.x for c in corners), min(c.y for c in corners), min(c.z for c in corners)))
+    max_co = Vector((max(c.x for c in corners), max(c.y for c in corners), max(c.z for c in corners)))
     
     return (min_co + max_co) / 2
 
@@ -352,6 +453,17 @@ def get_selection_center(context):
 # CLEANUP / GARBAGE COLLECTION
 # ============================================================================
 
+def is_camera_enum_item(scene, cam):
+    """True if cam is listed by the camera_enum items callback for this scene.
+
+    Mirrors properties.get_camera_items (camera objects in scene.objects),
+    so callers can skip assignments that would raise TypeError.
+    """
+    if cam is None or cam.type != 'CAMERA':
+        return False
+    return scene.objects.get(cam.name) is not None
+
+
 def cleanup_world_fake_users():
     """Remove fake_user from Worlds not referenced by any saved view."""
     try:
@@ -410,12 +522,15 @@ def create_camera_from_view_data(
     # Use provided scene or fall back to context.scene
     target_scene = scene if scene else context.scene
     
-    # Create camera data
+    # Create camera data. All data/object settings below are applied before
+    # the object is linked, so the depsgraph only evaluates the finished camera.
     cam_data = bpy.data.cameras.new(name)
     cam_data.passepartout_alpha = passepartout
     cam_data.show_passepartout = show_passepartout
     cam_data.clip_start = clip_start
     cam_data.clip_end = clip_end
+    cam_data.show_name = show_name
+    cam_data.show_sensor = show_sensor
     
     # Get viewport dimensions for sensor calculation
     viewport_width = context.region.width if context.region else 1920
@@ -451,8 +566,6 @@ def create_camera_from_view_data(
     
     # Display options
     cam_obj.show_name = show_name
-    cam_data.show_name = show_name
-    cam_data.show_sensor = show_sensor
     
     # Position camera
     cam_obj.location = Vector(location)
@@ -520,11 +633,45 @@ def sync_viewpilot_collection_names():
 @persistent
 def viewpilot_depsgraph_handler(scene, depsgraph):
     """Check for scene renames and sync collection names."""
-    # Check if any scene was updated (could be a rename)
+    global selection_dirty, camera_count_dirty, ids_dirty, geometry_version, collection_version, render_version
+    # Selection changes always come with a depsgraph update; viewport
+    # navigation does not, so idle monitor ticks can reuse the cached hash.
+    selection_dirty = True
+    
+    # Check if any scene was updated (could be a rename). Scene/collection
+    # updates also cover objects being added or removed, so they (and any
+    # camera update) invalidate the monitor's camera count. Geometry object
+    # and collection updates invalidate the dolly-to-obstacle BVH. Object,
+    # collection, material, light, world and node tree updates mark saved
+    # view thumbnails as possibly stale. Scene updates don't, since ViewPilot's
+    # own saved-view syncs touch the scene on every save.
+    scene_synced = False
     for update in depsgraph.updates:
-        if isinstance(update.id, bpy.types.Scene):
-            sync_viewpilot_collection_names()
-            break  # Only need to sync once per update batch
+        update_id = update.id
+        if isinstance(update_id, bpy.types.Scene):
+            camera_count_dirty = True
+            ids_dirty = True
+            collection_version += 1
+            if not scene_synced:
+                sync_viewpilot_collection_names()
+                scene_synced = True  # Only need to sync once per update batch
+        elif isinstance(update_id, bpy.types.Collection):
+            camera_count_dirty = True
+            ids_dirty = True
+            geometry_version += 1
+            collection_version += 1
+            render_version += 1
+        elif isinstance(update_id, bpy.types.Object):
+            ids_dirty = True
+            render_version += 1
+            if update_id.type == 'CAMERA':
+                camera_count_dirty = True
+            elif update_id.type in GEOMETRY_OBJECT_TYPES:
+                geometry_version += 1
+        elif isinstance(update_id, bpy.types.Camera):
+            ids_dirty = True
+        elif isinstance(update_id, RENDER_CONTENT_TYPES):
+            render_version += 1
 
 
 # ============================================================================
@@ -602,24 +749,27 @@ def states_are_similar(state1, state2, threshold=0.0001):
     """Check if two states are effectively identical."""
     if state1 is None or state2 is None: return False
     
-    # Compare Location
-    if (state1['view_location'] - state2['view_location']).length_squared > threshold: return False
+    # Plain scalar checks first - they're cheapest and bail out before any
+    # mathutils temporaries get allocated.
     
-    # Compare Rotation (Quaternion dot product)
-    # q1.dot(q2) is close to 1 or -1 if they are similar
-    rot_diff = abs(state1['view_rotation'].dot(state2['view_rotation']))
-    if rot_diff < 0.9999: return False
+    # Compare Perspective mode
+    if state1['is_perspective'] != state2['is_perspective']: return False
     
     # Compare Distance
     if abs(state1['view_distance'] - state2['view_distance']) > threshold: return False
     
-    # Compare Perspective mode
-    if state1['is_perspective'] != state2['is_perspective']: return False
-    
     # Compare Lens (focal length) - use relative threshold for lens values
     lens_threshold = 0.1  # 0.1mm difference is negligible
     if abs(state1['lens'] - state2['lens']) > lens_threshold: return False
     
+    # Compare Rotation (Quaternion dot product, no temporary)
+    # q1.dot(q2) is close to 1 or -1 if they are similar
+    rot_diff = abs(state1['view_rotation'].dot(state2['view_rotation']))
+    if rot_diff < 0.9999: return False
+    
+    # Compare Location
+    if (state1['view_location'] - state2['view_location']).length_squared > threshold: return False
+    
     return True
 
 
@@ -635,8 +785,9 @@ def add_to_history(state):
     
     # 1. If we are not at the end of history, we are creating a NEW branch.
     #    Discard all "future" states.
-    if view_history_index != -1 and view_history_index < len(view_history) - 1:
-        view_history = view_history[:view_history_index + 1]
+    if view_history_index != -1:
+        while len(view_history) > view_history_index + 1:
+            view_history.pop()
     
     # 2. Check if this new state is different enough from the LAST state
     if view_history:
@@ -644,17 +795,19 @@ def add_to_history(state):
         if states_are_similar(state, last_state):
             return # Don't save duplicates
             
-    # 3. Add to history
-    view_history.append(state)
-    
-    # 4. Cap size - use preference if available, fallback to default
+    # 3. Cap size - use preference if available, fallback to default.
+    #    The deque's maxlen evicts the oldest state on append; it only needs
+    #    rebuilding (keeping the newest states) when the preference changed.
     try:
         from .preferences import get_preferences
         max_size = get_preferences().history_max_size
     except (ImportError, AttributeError, TypeError, ValueError, RuntimeError):
-        max_size = 20
-    if len(view_history) > max_size:
-        view_history.pop(0)
+        max_size = VIEW_HISTORY_MAX
+    if view_history.maxlen != max_size:
+        view_history = deque(view_history, maxlen=max_size)
+    
+    # 4. Add to history
+    view_history.append(state)
         
     # 5. Reset index to "Live" (end of list)
     view_history_index = len(view_history) - 1
@@ -779,9 +932,11 @@ def history_go_forward(context):
 @persistent
 def reset_history_handler(dummy):
     """Clear history, initialize data storage, and restart monitor when loading a new file."""
-    global view_history, view_history_index
+    global view_history, view_history_index, reinit_signature
     view_history.clear()
     view_history_index = -1
+    # Holds datablock pointers from the previous file
+    reinit_signature = None
     
     # Initialize data storage (creates Text datablock if needed)
     # This is deferred to load_post because bpy.data.texts isn't available during registration